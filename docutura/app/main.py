@@ -21,9 +21,9 @@ def initialize_plugins() -> PluginRegistry:
     """Initialize and register all plugins."""
     registry = PluginRegistry()
 
-    # Register built-in plugins
-    registry.register(WAECMarksDistributionPlugin())
-    registry.register(InternationalStaffListPlugin())
+    # Register built-in plugin factories (instantiated on first detection)
+    registry.register("waec_marksdist", WAECMarksDistributionPlugin)
+    registry.register("international_staff_list", InternationalStaffListPlugin)
 
     return registry
 
@@ -4,12 +4,13 @@ Main window for DocTura Desktop.
 Provides file selection, configuration, and conversion interface.
 """
 
-import platform
-import subprocess
+import os
+from collections import deque
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Set
 
-from PySide6.QtCore import QThread, Qt, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, QTimer, QUrl, Signal
+from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -39,28 +40,43 @@ from docutura.core.models import (
 )
 from docutura.core.themes import ThemeType, get_qt_stylesheet, get_theme
 
+# Upper bound on documents converted at the same time
+_MAX_CONVERSION_THREADS = 4
 
-class ConversionWorker(QThread):
-    """Background worker for document conversion."""
+# Interval for flushing buffered log messages to the log view
+_LOG_FLUSH_INTERVAL_MS = 100
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by a BatchConversionWorker (QRunnable cannot emit signals itself)."""
 
     progress = Signal(str)  # Progress message
-    finished = Signal(object)  # ConversionResult
+    batch_finished = Signal(list)  # List[ConversionResult] for the whole shard
     error = Signal(str)  # Error message
 
-    def __init__(self, controller: ConversionController, input_file: Path, options: ExtractionOptions):
+
+class BatchConversionWorker(QRunnable):
+    """Background worker for converting a shard of documents on a thread pool."""
+
+    def __init__(
+        self, controller: ConversionController, input_files: List[Path], options: ExtractionOptions
+    ):
         super().__init__()
+        self.signals = WorkerSignals()
         self.controller = controller
-        self.input_file = input_file
+        self.input_files = input_files
         self.options = options
 
     def run(self):
-        """Run conversion in background."""
-        try:
-            self.progress.emit(f"Processing {self.input_file.name}...")
-            result = self.controller.convert_document(self.input_file, self.options)
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
+        """Run conversions in background, reporting results once per shard."""
+        results = []
+        for input_file in self.input_files:
+            try:
+                self.signals.progress.emit(f"Processing {input_file.name}...")
+                results.append(self.controller.convert_document(input_file, self.options))
+            except Exception as e:
+                self.signals.error.emit(str(e))
+        self.signals.batch_finished.emit(results)
 
 
 class MainWindow(QMainWindow):
@@ -71,9 +87,17 @@ class MainWindow(QMainWindow):
 
         self.controller = controller
         self.selected_files: List[Path] = []
-        self.current_worker: Optional[ConversionWorker] = None
+        self._selected_set: Set[Path] = set()  # Mirrors selected_files for O(1) lookups
+        self.active_workers: List[BatchConversionWorker] = []
+        self._completed = 0
+        self._files_done = 0
         self.current_theme = ThemeType.CORPORATE
 
+        # Persistent pool: worker threads stay warm between conversions
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(min(_MAX_CONVERSION_THREADS, os.cpu_count() or 1))
+        self.pool.setExpiryTimeout(-1)
+
         self.setWindowTitle("DocTura Desktop - Document Intelligence")
         self.setMinimumSize(900, 700)
 
@@ -142,6 +166,12 @@ class MainWindow(QMainWindow):
         self.log_output.setMaximumHeight(150)
         main_layout.addWidget(self.log_output)
 
+        # Buffer log messages and flush them in one layout pass per tick
+        self._log_buf: deque = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(_LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+
         main_layout.addStretch()
 
     def _create_file_selection_group(self) -> QGroupBox:
@@ -198,6 +228,13 @@ class MainWindow(QMainWindow):
         self.csv_check = QCheckBox("CSV")
         formats_layout.addWidget(self.csv_check)
 
+        # Checkbox -> format pairs, in output order
+        self._format_map = [
+            (self.xlsx_check, OutputFormat.XLSX),
+            (self.docx_check, OutputFormat.DOCX),
+            (self.csv_check, OutputFormat.CSV),
+        ]
+
         formats_layout.addStretch()
         layout.addLayout(formats_layout)
 
@@ -262,14 +299,23 @@ class MainWindow(QMainWindow):
         file_dialog.setNameFilter("Documents (*.pdf *.docx *.doc *.png *.jpg *.jpeg)")
 
         if file_dialog.exec():
-            files = file_dialog.selectedFiles()
-            for file_path in files:
+            new_paths = []
+            new_names = []
+
+            for file_path in file_dialog.selectedFiles():
                 path = Path(file_path)
-                if path not in self.selected_files:
-                    self.selected_files.append(path)
-                    self.file_list.addItem(path.name)
+                if path not in self._selected_set:
+                    self._selected_set.add(path)
+                    new_paths.append(path)
+                    new_names.append(path.name)
 
-        self.convert_btn.setEnabled(len(self.selected_files) > 0)
+            # Add in one batch so the list repaints once
+            self.selected_files.extend(new_paths)
+            self.file_list.setUpdatesEnabled(False)
+            self.file_list.addItems(new_names)
+            self.file_list.setUpdatesEnabled(True)
+
+        self.convert_btn.setEnabled(bool(self.selected_files))
 
     def _remove_selected_files(self):
         """Remove selected files from list."""
@@ -277,7 +323,7 @@ class MainWindow(QMainWindow):
         for item in selected_items:
             row = self.file_list.row(item)
             self.file_list.takeItem(row)
-            del self.selected_files[row]
+            self._selected_set.discard(self.selected_files.pop(row))
 
         self.convert_btn.setEnabled(len(self.selected_files) > 0)
 
@@ -285,6 +331,7 @@ class MainWindow(QMainWindow):
         """Clear all files."""
         self.file_list.clear()
         self.selected_files.clear()
+        self._selected_set.clear()
         self.convert_btn.setEnabled(False)
 
     def _change_theme(self, theme_type: ThemeType):
@@ -298,20 +345,12 @@ class MainWindow(QMainWindow):
 
     def _apply_theme(self, theme_type: ThemeType):
         """Apply theme to application."""
-        theme = get_theme(theme_type)
-        stylesheet = get_qt_stylesheet(theme)
-        self.setStyleSheet(stylesheet)
+        self.setStyleSheet(get_qt_stylesheet(get_theme(theme_type)))
 
     def _get_extraction_options(self) -> ExtractionOptions:
         """Build extraction options from UI."""
         # Output formats
-        formats = []
-        if self.xlsx_check.isChecked():
-            formats.append(OutputFormat.XLSX)
-        if self.docx_check.isChecked():
-            formats.append(OutputFormat.DOCX)
-        if self.csv_check.isChecked():
-            formats.append(OutputFormat.CSV)
+        formats = [fmt for check, fmt in self._format_map if check.isChecked()]
 
         # Word orientation
         word_orientation = (
@@ -345,61 +384,75 @@ class MainWindow(QMainWindow):
         # Get options
         self.conversion_options = self._get_extraction_options()
 
-        # Process first file
-        self.current_file_index = 0
-        self._process_next_file()
-
-    def _process_next_file(self):
-        """Process next file in queue."""
-        if self.current_file_index >= len(self.selected_files):
-            # All files processed
-            self._conversion_complete()
-            return
-
-        input_file = self.selected_files[self.current_file_index]
-
-        # Start worker
-        self.current_worker = ConversionWorker(
-            self.controller, input_file, self.conversion_options
-        )
-        self.current_worker.progress.connect(self._on_progress)
-        self.current_worker.finished.connect(self._on_file_complete)
-        self.current_worker.error.connect(self._on_error)
-        self.current_worker.start()
+        # Split files into one shard per pool thread so each worker reports back once
+        self._completed = 0
+        self._files_done = 0
+        self._log_timer.start()
+
+        shard_count = min(self.pool.maxThreadCount(), len(self.selected_files))
+        for i in range(shard_count):
+            shard = self.selected_files[i::shard_count]
+            worker = BatchConversionWorker(self.controller, shard, self.conversion_options)
+            # Cross-thread signals are queued, so the slots run on the UI thread
+            worker.signals.progress.connect(self._on_progress)
+            worker.signals.batch_finished.connect(self._on_batch_complete)
+            worker.signals.error.connect(self._on_error)
+            self.active_workers.append(worker)
+        # Start only once every shard is registered so completion counting is exact
+        for worker in self.active_workers:
+            self.pool.start(worker)
+
+    def _advance_progress(self, count: int):
+        """Advance the progress bar by a number of processed files."""
+        self._files_done += count
+        self.progress_bar.setValue(self._files_done)
+
+    def _log(self, message: str):
+        """Queue a message for the log view."""
+        self._log_buf.append(message)
+
+    def _flush_log(self):
+        """Append all buffered log messages at once."""
+        if self._log_buf:
+            self.log_output.append("\n".join(self._log_buf))
+            self._log_buf.clear()
 
     def _on_progress(self, message: str):
         """Handle progress update."""
-        self.log_output.append(message)
-
-    def _on_file_complete(self, result: ConversionResult):
-        """Handle file conversion complete."""
-        self.progress_bar.setValue(self.current_file_index + 1)
-
-        if result.success:
-            self.log_output.append(f"✓ {result.input_file.name}: {result.get_summary()}")
-
-            # Show validation status
-            if result.validation_report.overall_status.value != "passed":
-                self.log_output.append(
-                    f"  ⚠ Validation: {result.validation_report.overall_status.value.upper()} "
-                    f"({len(result.validation_report.issues)} issues)"
-                )
-        else:
-            self.log_output.append(f"✗ {result.input_file.name}: {result.error_message}")
-
-        # Process next file
-        self.current_file_index += 1
-        self._process_next_file()
+        self._log(message)
+
+    def _on_batch_complete(self, results: List[ConversionResult]):
+        """Handle a finished shard of conversions."""
+        for result in results:
+            if result.success:
+                self._log(f"✓ {result.input_file.name}: {result.get_summary()}")
+
+                # Show validation status
+                if result.validation_report.overall_status.value != "passed":
+                    self._log(
+                        f"  ⚠ Validation: {result.validation_report.overall_status.value.upper()} "
+                        f"({len(result.validation_report.issues)} issues)"
+                    )
+            else:
+                self._log(f"✗ {result.input_file.name}: {result.error_message}")
+
+        self._advance_progress(len(results))
+
+        self._completed += 1
+        if self._completed >= len(self.active_workers):
+            self.active_workers.clear()
+            self._conversion_complete()
 
     def _on_error(self, error_message: str):
         """Handle conversion error."""
-        self.log_output.append(f"ERROR: {error_message}")
-        self.current_file_index += 1
-        self._process_next_file()
+        self._log(f"ERROR: {error_message}")
+        self._advance_progress(1)
 
     def _conversion_complete(self):
         """Handle all conversions complete."""
-        self.log_output.append("\n=== Conversion Complete ===")
+        self._log("\n=== Conversion Complete ===")
+        self._log_timer.stop()
+        self._flush_log()
 
         # Re-enable UI
         self.convert_btn.setEnabled(True)
@@ -420,9 +473,5 @@ class MainWindow(QMainWindow):
         """Open output folder in file explorer."""
         output_dir = self.controller.output_dir
 
-        if platform.system() == "Windows":
-            subprocess.run(["explorer", str(output_dir)])
-        elif platform.system() == "Darwin":  # macOS
-            subprocess.run(["open", str(output_dir)])
-        else:  # Linux
-            subprocess.run(["xdg-open", str(output_dir)])
+        # Hands off to the platform shell without blocking the event loop
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(output_dir)))
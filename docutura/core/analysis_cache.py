@@ -0,0 +1,121 @@
+"""
+Analysis cache serialization for DocTura Desktop.
+
+Cache entries are stored as plain JSON rather than pickles, so reading a
+tampered cache file can at worst produce a cache miss, never run code.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from docutura.core.models import (
+    ExtractedTable,
+    ScoreDomain,
+    SegmentationStrategy,
+    TableSchema,
+    ValidationIssue,
+    ValidationReport,
+    ValidationStatus,
+)
+
+
+def encode_extraction(
+    tables_data: List[Dict[str, Any]], page_texts: List[str], context: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Convert extraction results to a JSON-serializable entry."""
+    return {"tables_data": tables_data, "page_texts": page_texts, "context": context}
+
+
+def decode_extraction(
+    entry: Dict[str, Any],
+) -> Tuple[List[Dict[str, Any]], List[str], Dict[str, Any]]:
+    """Rebuild (tables_data, page_texts, context) from a cache entry."""
+    return entry["tables_data"], entry["page_texts"], entry["context"]
+
+
+def encode_analysis(
+    logical_tables: List[ExtractedTable], validation_report: ValidationReport
+) -> Dict[str, Any]:
+    """Convert segmentation and validation results to a JSON-serializable entry."""
+    return {
+        "logical_tables": [_encode_table(table) for table in logical_tables],
+        "validation_report": validation_report.to_dict(),
+    }
+
+
+def decode_analysis(entry: Dict[str, Any]) -> Tuple[List[ExtractedTable], ValidationReport]:
+    """Rebuild (logical_tables, validation_report) from a cache entry."""
+    logical_tables = [_decode_table(table) for table in entry["logical_tables"]]
+    return logical_tables, _decode_report(entry["validation_report"])
+
+
+def _encode_table(table: ExtractedTable) -> Dict[str, Any]:
+    """Convert a table to plain values."""
+    schema = table.schema
+    strategy = table.segmentation_strategy
+    domain = table.score_domain
+
+    return {
+        "data": table.data,
+        "schema": {
+            "headers": schema.headers,
+            "column_count": schema.column_count,
+            "has_header": schema.has_header,
+            "header_row_indices": schema.header_row_indices,
+        },
+        "source_pages": table.source_pages,
+        "table_type": table.table_type,
+        "segmentation_strategy": getattr(strategy, "value", strategy),
+        "section_title": table.section_title,
+        "score_domain": (
+            {
+                "name": domain.name,
+                "min_score": domain.min_score,
+                "max_score": domain.max_score,
+                "description": domain.description,
+            }
+            if domain is not None
+            else None
+        ),
+    }
+
+
+def _decode_table(entry: Dict[str, Any]) -> ExtractedTable:
+    """Rebuild a table from plain values."""
+    strategy: Optional[str] = entry["segmentation_strategy"]
+    domain: Optional[Dict[str, Any]] = entry["score_domain"]
+
+    return ExtractedTable(
+        data=entry["data"],
+        schema=TableSchema(**entry["schema"]),
+        source_pages=entry["source_pages"],
+        table_type=entry["table_type"],
+        segmentation_strategy=SegmentationStrategy(strategy) if strategy is not None else None,
+        section_title=entry["section_title"],
+        score_domain=ScoreDomain(**domain) if domain is not None else None,
+    )
+
+
+def _decode_report(entry: Dict[str, Any]) -> ValidationReport:
+    """Rebuild a validation report from ValidationReport.to_dict() output."""
+    summary = entry["summary"]
+
+    return ValidationReport(
+        overall_status=ValidationStatus(entry["overall_status"]),
+        issues=[
+            ValidationIssue(
+                severity=ValidationStatus(issue["severity"]),
+                message=issue["message"],
+                table_name=issue["table_name"],
+                row_index=issue["row_index"],
+                column_name=issue["column_name"],
+                details=issue["details"],
+            )
+            for issue in entry["issues"]
+        ],
+        tables_validated=summary["tables_validated"],
+        tables_passed=summary["tables_passed"],
+        tables_with_warnings=summary["tables_with_warnings"],
+        tables_failed=summary["tables_failed"],
+        timestamp=datetime.fromisoformat(entry["timestamp"]),
+    )
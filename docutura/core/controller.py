@@ -4,13 +4,26 @@ Main conversion controller for DocTura Desktop.
 Orchestrates the complete document conversion pipeline.
 """
 
+import atexit
 import hashlib
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
+from docutura.core.analysis_cache import (
+    decode_analysis,
+    decode_extraction,
+    encode_analysis,
+    encode_extraction,
+)
 from docutura.core.csv_writer import CSVWriter
-from docutura.core.excel_writer import ExcelWriter
 from docutura.core.extractor import DocumentExtractor
 from docutura.core.models import (
     ConversionResult,
@@ -26,10 +39,20 @@ from docutura.core.naming import SmartNamingEngine
 from docutura.core.segmentation import TableSegmenter
 from docutura.core.themes import THEMES, ThemeType, get_theme
 from docutura.core.validator import TableValidator
-from docutura.core.word_writer import WordWriter
-from docutura.enterprise.audit import AuditLogger
 from docutura.plugins.base import DocumentPlugin, PluginRegistry
 
+if TYPE_CHECKING:
+    # Imported lazily at runtime: openpyxl/python-docx are only needed when
+    # the matching output format is requested
+    from docutura.core.excel_writer import ExcelWriter
+    from docutura.core.word_writer import WordWriter
+
+# Bump whenever the extraction/segmentation/validation output changes shape
+CACHE_VERSION = 6
+
+# Cache problems are logged rather than printed; the cache is best effort
+logger = logging.getLogger(__name__)
+
 
 class ConversionController:
     """Main controller for document conversion."""
@@ -52,12 +75,44 @@ class ConversionController:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Cached extraction results keyed by input hash and extraction options, and
+        # segmentation/validation results keyed additionally by plugin id and version
+        self.cache_dir = output_dir.parent / "Cache"
+
         # Initialize audit logger if directory provided
-        self.audit_logger = AuditLogger(audit_dir) if audit_dir else None
+        if audit_dir:
+            from docutura.enterprise.audit import AuditLogger
+
+            self.audit_logger = AuditLogger(audit_dir)
+
+            # Audit entries are written by a background thread off the conversion path
+            self._audit_q: "queue.Queue[ConversionResult]" = queue.Queue()
+            self._audit_thread = threading.Thread(
+                target=self._audit_drain, name="docutura-audit", daemon=True
+            )
+            self._audit_thread.start()
+            atexit.register(self.flush_audit_log)
+        else:
+            self.audit_logger = None
 
         # Initialize naming engine
         self.naming_engine = SmartNamingEngine()
 
+        # Output writers hold configuration only, so they are reused across documents
+        self._excel_writers: Dict[tuple, "ExcelWriter"] = {}
+        self._word_writers: Dict[tuple, "WordWriter"] = {}
+        self._csv_writer = CSVWriter()
+
+        # Output generators by format (all share the same signature)
+        self._dispatch = {
+            OutputFormat.XLSX: self._generate_excel_output,
+            OutputFormat.DOCX: self._generate_word_output,
+            OutputFormat.CSV: self._generate_csv_output,
+        }
+
+        # Background pool for hashing input files while they are extracted
+        self._hash_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="docutura-hash")
+
     def convert_document(
         self, input_file: Path, options: ExtractionOptions
     ) -> ConversionResult:
@@ -74,16 +129,46 @@ class ConversionController:
         start_time = time.time()
 
         try:
-            # Step 1: Extract content
+            # Hash the input concurrently with extraction (hashlib releases the GIL)
+            hash_future = self._hash_pool.submit(DocumentMetadata.compute_hash, input_file)
+
             extractor = DocumentExtractor(
                 enable_ocr=options.enable_ocr, ocr_language=options.ocr_language
             )
 
-            tables_data, page_texts, context = extractor.extract(input_file)
+            # Reuse a previous extraction of the same file with the same options; the
+            # hash is only awaited up front if this path/size/mtime was cached before
+            cache_key = None
+            cached = None
+
+            if options.cache_enabled and self._may_be_cached(input_file):
+                cache_key = self._get_cache_key(hash_future.result(), options)
+                cached = self._load_cached_entry(cache_key, decode_extraction)
 
-            # Step 2: Detect plugin
+            if cached:
+                print(f"Using cached extraction for {input_file.name}")
+                tables_data, page_texts, context = cached
+            else:
+                # Step 1: Extract content
+                tables_data, page_texts, context = extractor.extract(input_file)
+
+                if options.cache_enabled:
+                    if cache_key is None:
+                        cache_key = self._get_cache_key(hash_future.result(), options)
+                    self._store_cached_entry(
+                        cache_key, encode_extraction(tables_data, page_texts, context)
+                    )
+                    self._mark_cached(input_file)
+
+            # Step 2: Detect plugin (page text is joined and uppercased once for all plugins)
+            full_text = " ".join(page_texts)
+            plugin_context = {
+                **context,
+                "full_text": full_text,
+                "full_text_upper": full_text.upper(),
+            }
             plugin_result = self.plugin_registry.detect_plugin(
-                tables_data, page_texts, context
+                tables_data, page_texts, plugin_context
             )
 
             if plugin_result:
@@ -99,30 +184,48 @@ class ConversionController:
             # Step 3: Create page-preserved tables
             page_tables = extractor.create_page_preserved_tables(tables_data)
 
-            # Step 4: Segment logical tables
-            segmenter = TableSegmenter()
+            # Segmentation and validation depend on the plugin that handled the file
+            analysis_key = None
+            analysis = None
 
-            if plugin:
-                strategy = plugin.get_segmentation_strategy()
-                score_domains = plugin.get_score_domains()
-            else:
-                strategy = segmenter._detect_strategy(tables_data)
-                score_domains = None
+            if cache_key:
+                analysis_key = self._get_analysis_cache_key(cache_key, plugin, options)
+                analysis = self._load_cached_entry(analysis_key, decode_analysis)
 
-            logical_tables = segmenter.segment_tables(
-                tables_data, strategy, score_domains=score_domains
-            )
+            if analysis:
+                print(f"Using cached analysis for {input_file.name}")
+                logical_tables, validation_report = analysis
+
+            # Step 4: Segment logical tables
+            if not analysis:
+                segmenter = TableSegmenter()
+
+                if plugin:
+                    strategy = plugin.get_segmentation_strategy()
+                    score_domains = plugin.get_score_domains()
+                else:
+                    strategy = segmenter._detect_strategy(tables_data)
+                    score_domains = None
+
+                logical_tables = segmenter.segment_tables(
+                    tables_data, strategy, score_domains=score_domains
+                )
 
             # Step 5: Extract metadata
             if plugin:
-                metadata = plugin.extract_metadata(tables_data, page_texts, context)
+                # Values found during detection are passed on rather than searched again
+                metadata = plugin.extract_metadata(
+                    tables_data,
+                    page_texts,
+                    {**plugin_context, "detection_metadata": detection.metadata},
+                )
                 metadata.plugin_confidence = detection.confidence
             else:
                 metadata = DocumentMetadata()
 
             # Complete metadata
             metadata.input_file_path = str(input_file)
-            metadata.input_file_hash = self._compute_file_hash(input_file)
+            metadata.input_file_hash = hash_future.result()
             metadata.extraction_mode = options.mode if isinstance(options.mode, str) else options.mode.value
             metadata.excel_layout_mode = options.excel_layout if isinstance(options.excel_layout, str) else options.excel_layout.value
             metadata.word_orientation = options.word_orientation if isinstance(options.word_orientation, str) else options.word_orientation.value
@@ -130,23 +233,28 @@ class ConversionController:
             metadata.theme = options.theme
 
             # Step 6: Validate tables
-            validator = TableValidator(tolerance=options.validation_tolerance)
-
-            # Get tables based on extraction mode
-            routed = RoutedTables(page_tables=page_tables, logical_tables=logical_tables)
-            tables_to_validate = routed.get_all_tables(options.mode)
+            if not analysis:
+                if options.validation_enabled:
+                    # Get tables based on extraction mode
+                    routed = RoutedTables(page_tables=page_tables, logical_tables=logical_tables)
+                    tables_to_validate = routed.get_all_tables(options.mode)
+
+                    validator = TableValidator(tolerance=options.validation_tolerance)
+                    validation_report = validator.validate_tables(tables_to_validate)
+                else:
+                    validation_report = ValidationReport(
+                        overall_status=ValidationStatus.PASSED,
+                        issues=[],
+                        tables_validated=0,
+                        tables_passed=0,
+                        tables_with_warnings=0,
+                        tables_failed=0,
+                    )
 
-            if options.validation_enabled:
-                validation_report = validator.validate_tables(tables_to_validate)
-            else:
-                validation_report = ValidationReport(
-                    overall_status=ValidationStatus.PASSED,
-                    issues=[],
-                    tables_validated=0,
-                    tables_passed=0,
-                    tables_with_warnings=0,
-                    tables_failed=0,
-                )
+                if analysis_key:
+                    self._store_cached_entry(
+                        analysis_key, encode_analysis(logical_tables, validation_report)
+                    )
 
             # Update metadata with validation info
             metadata.validation_status = validation_report.overall_status if isinstance(validation_report.overall_status, str) else validation_report.overall_status.value
@@ -162,36 +270,31 @@ class ConversionController:
             )
             output_subdir.mkdir(parents=True, exist_ok=True)
 
-            for output_format in options.output_formats:
-                if output_format == OutputFormat.XLSX:
-                    output_path = self._generate_excel_output(
-                        output_subdir,
-                        input_file,
-                        page_tables,
-                        logical_tables,
-                        metadata,
-                        validation_report,
-                        options,
-                        theme,
-                    )
-                    output_files.append(output_path)
-
-                elif output_format == OutputFormat.DOCX:
-                    output_path = self._generate_word_output(
-                        output_subdir,
-                        input_file,
-                        logical_tables,
-                        metadata,
-                        options,
-                        theme,
-                    )
-                    output_files.append(output_path)
-
-                elif output_format == OutputFormat.CSV:
-                    csv_files = self._generate_csv_output(
-                        output_subdir, input_file, logical_tables, metadata, options
-                    )
-                    output_files.extend(csv_files)
+            # Formats write disjoint files from read-only tables, so generate them in parallel
+            generators = [
+                self._dispatch[fmt] for fmt in options.output_formats if fmt in self._dispatch
+            ]
+
+            if generators:
+                with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+                    futures = [
+                        executor.submit(
+                            generate,
+                            output_subdir,
+                            input_file,
+                            page_tables,
+                            logical_tables,
+                            metadata,
+                            validation_report,
+                            options,
+                            theme,
+                        )
+                        for generate in generators
+                    ]
+
+                    # Collect in submission order so output order follows the options
+                    for future in futures:
+                        output_files.extend(future.result())
 
             # Step 8: Create result
             processing_time = time.time() - start_time
@@ -207,7 +310,7 @@ class ConversionController:
 
             # Step 9: Audit logging
             if self.audit_logger and options.audit_logging_enabled:
-                self.audit_logger.log_conversion(result)
+                self._audit_q.put(result)
 
             return result
 
@@ -232,16 +335,54 @@ class ConversionController:
                 processing_time_seconds=processing_time,
             )
 
+    def _audit_drain(self) -> None:
+        """Write queued conversion results to the audit log (background thread)."""
+        while True:
+            result = self._audit_q.get()
+            try:
+                self.audit_logger.log_conversion(result)
+
+                # Append the batched index entries once the queue runs dry
+                if self._audit_q.empty():
+                    self.audit_logger.flush()
+            except Exception as e:
+                print(f"Audit logging failed for {result.input_file.name}: {e}")
+            finally:
+                self._audit_q.task_done()
+
+    def flush_audit_log(self) -> None:
+        """Block until all queued audit entries have been written."""
+        if self.audit_logger:
+            self._audit_q.join()
+            self.audit_logger.flush()
+
     def _generate_excel_output(
         self, output_dir, input_file, page_tables, logical_tables, metadata, validation_report, options, theme
-    ) -> Path:
+    ) -> List[Path]:
         """Generate Excel output."""
-        writer = ExcelWriter(
-            layout_mode=options.excel_layout,
-            add_borders=options.excel_add_borders,
-            freeze_headers=options.excel_freeze_headers,
-            theme=theme,
+        from docutura.core.excel_writer import ExcelWriter
+
+        key = (
+            options.excel_layout,
+            options.theme,
+            options.excel_add_borders,
+            options.excel_freeze_headers,
+            options.excel_streaming,
+            options.excel_backend,
         )
+        writer = self._excel_writers.get(key)
+        if writer is None:
+            writer = self._excel_writers.setdefault(
+                key,
+                ExcelWriter(
+                    layout_mode=options.excel_layout,
+                    add_borders=options.excel_add_borders,
+                    freeze_headers=options.excel_freeze_headers,
+                    theme=theme,
+                    streaming=options.excel_streaming,
+                    backend=options.excel_backend,
+                ),
+            )
 
         output_name = self.naming_engine.generate_output_name(
             input_file, metadata, OutputFormat.XLSX
@@ -256,18 +397,31 @@ class ConversionController:
             validation_report,
         )
 
-        return output_path
+        return [output_path]
 
     def _generate_word_output(
-        self, output_dir, input_file, logical_tables, metadata, options, theme
-    ) -> Path:
+        self, output_dir, input_file, page_tables, logical_tables, metadata, validation_report, options, theme
+    ) -> List[Path]:
         """Generate Word output."""
-        writer = WordWriter(
-            orientation=options.word_orientation,
-            page_break_per_table=options.word_page_break_per_table,
-            include_images=options.word_include_images,
-            theme=theme,
+        from docutura.core.word_writer import WordWriter
+
+        key = (
+            options.word_orientation,
+            options.theme,
+            options.word_page_break_per_table,
+            options.word_include_images,
         )
+        writer = self._word_writers.get(key)
+        if writer is None:
+            writer = self._word_writers.setdefault(
+                key,
+                WordWriter(
+                    orientation=options.word_orientation,
+                    page_break_per_table=options.word_page_break_per_table,
+                    include_images=options.word_include_images,
+                    theme=theme,
+                ),
+            )
 
         output_name = self.naming_engine.generate_output_name(
             input_file, metadata, OutputFormat.DOCX
@@ -276,13 +430,13 @@ class ConversionController:
 
         writer.write_to_word(output_path, logical_tables, metadata)
 
-        return output_path
+        return [output_path]
 
     def _generate_csv_output(
-        self, output_dir, input_file, logical_tables, metadata, options
+        self, output_dir, input_file, page_tables, logical_tables, metadata, validation_report, options, theme
     ) -> List[Path]:
         """Generate CSV output(s)."""
-        writer = CSVWriter()
+        writer = self._csv_writer
 
         base_name = self.naming_engine._sanitize(
             metadata.subject_or_code if metadata.subject_or_code else input_file.stem
@@ -293,12 +447,87 @@ class ConversionController:
         )
 
     @staticmethod
-    def _compute_file_hash(file_path: Path) -> str:
-        """Compute SHA-256 hash of file."""
-        sha256 = hashlib.sha256()
+    def _get_cache_key(file_hash: str, options: ExtractionOptions) -> str:
+        """Build the extraction cache key from the input hash and extraction options."""
+        options_tuple = (CACHE_VERSION, options.enable_ocr, options.ocr_language)
 
-        with open(file_path, "rb") as f:
-            while chunk := f.read(8192):
-                sha256.update(chunk)
+        return hashlib.blake2b(
+            file_hash.encode() + repr(options_tuple).encode(), digest_size=16
+        ).hexdigest()
 
-        return sha256.hexdigest()
+    @staticmethod
+    def _get_analysis_cache_key(
+        cache_key: str, plugin: Optional[DocumentPlugin], options: ExtractionOptions
+    ) -> str:
+        """Build the segmentation/validation cache key for the detected plugin."""
+        analysis_tuple = (
+            plugin.get_plugin_id() if plugin else None,
+            plugin.get_version() if plugin else None,
+            options.mode,
+            options.validation_enabled,
+            options.validation_tolerance,
+        )
+
+        return hashlib.blake2b(
+            cache_key.encode() + repr(analysis_tuple).encode(), digest_size=16
+        ).hexdigest()
+
+    def _stat_marker(self, input_file: Path) -> Path:
+        """Marker file recording that this path, size and mtime have been cached."""
+        stat = input_file.stat()
+        stat_key = f"{input_file.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}"
+        marker = hashlib.blake2b(stat_key.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{marker}.seen"
+
+    def _may_be_cached(self, input_file: Path) -> bool:
+        """Cheap pre-check: False when no cache entry can exist for this input."""
+        try:
+            return self._stat_marker(input_file).exists()
+        except OSError:
+            return False
+
+    def _mark_cached(self, input_file: Path) -> None:
+        """Record that a cache entry exists for this input (best effort)."""
+        try:
+            self._stat_marker(input_file).touch()
+        except OSError:
+            pass
+
+    def _load_cached_entry(
+        self, cache_key: str, decode: Callable[[Dict[str, Any]], Tuple]
+    ) -> Optional[Tuple]:
+        """Load and decode a cached JSON entry, or None on a miss."""
+        cache_file = self.cache_dir / f"{cache_key}.json"
+
+        try:
+            with open(cache_file, "rb") as f:
+                return decode(json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Corrupt or incompatible entry: treat as a miss
+            logger.warning("Ignoring unreadable cache entry %s: %s", cache_file.name, e)
+            return None
+
+    def _store_cached_entry(self, cache_key: str, entry: Dict[str, Any]) -> None:
+        """Store a JSON entry in the cache (best effort)."""
+        cache_file = self.cache_dir / f"{cache_key}.json"
+        tmp_name = None
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Unique temp file per write, so concurrent conversions never share one
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                tmp_name = f.name
+                f.write(json.dumps(entry, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_name, cache_file)
+        except Exception as e:
+            logger.warning("Could not write cache entry %s: %s", cache_file.name, e)
+            if tmp_name:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
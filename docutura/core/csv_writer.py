@@ -5,11 +5,30 @@ Supports per-sheet and combined CSV export.
 """
 
 import csv
+import io
+import re
 from pathlib import Path
 from typing import List
 
 from docutura.core.models import ExtractedTable
 
+# Large write buffer so each table is flushed in a few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Characters that force quoting under the default (excel) csv dialect
+_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
+
+
+def _format_row(row: List[str]) -> str:
+    """Format a row of strings exactly as csv.writer's excel dialect would."""
+    if len(row) == 1 and not row[0]:
+        return '""'  # csv quotes a lone empty field so the row is not blank
+
+    return ",".join(
+        '"' + cell.replace('"', '""') + '"' if _NEEDS_QUOTING.search(cell) else cell
+        for cell in row
+    )
+
 
 class CSVWriter:
     """Writes extracted tables to CSV files."""
@@ -47,8 +66,7 @@ class CSVWriter:
         else:
             # Write each table to a separate CSV file
             for idx, table in enumerate(tables, start=1):
-                filename = f"{base_name}_table_{idx}.csv"
-                output_path = output_dir / filename
+                output_path = output_dir / f"{base_name}_table_{idx}.csv"
                 self._write_single_table_csv(output_path, table)
                 created_files.append(output_path)
 
@@ -56,29 +74,41 @@ class CSVWriter:
 
     def _write_single_table_csv(self, output_path: Path, table: ExtractedTable) -> None:
         """Write a single table to CSV."""
-        with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
+        # Fast path: all-string tables are formatted in one pass and written as one block
+        if all(cell.__class__ is str for row in table.data for cell in row):
+            payload = "".join(_format_row(row) + "\r\n" for row in table.data)
+            with open(output_path, "wb") as csvfile:
+                csvfile.write(payload.encode("utf-8"))
+            return
+
+        with open(
+            output_path, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as csvfile:
             writer = csv.writer(csvfile)
-
-            for row in table.data:
-                writer.writerow(row)
+            writer.writerows(table.data)
 
     def _write_combined_csv(
         self, output_path: Path, tables: List[ExtractedTable]
     ) -> None:
         """Write all tables to a single CSV file."""
-        with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.writer(csvfile)
-
-            for table_idx, table in enumerate(tables):
-                # Add separator comment between tables
-                if table_idx > 0:
-                    writer.writerow([])  # Blank row
-                    writer.writerow([f"--- Table {table_idx + 1} ---"])
-
-                # Add section title if available
-                if table.section_title:
-                    writer.writerow([f"Section: {table.section_title}"])
-
-                # Write table data
-                for row in table.data:
-                    writer.writerow(row)
+        # Build the whole file in memory and hand it to the OS in one write
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+
+        for table_idx, table in enumerate(tables):
+            # Add separator comment between tables
+            if table_idx > 0:
+                writer.writerow([])  # Blank row
+                writer.writerow([f"--- Table {table_idx + 1} ---"])
+
+            # Add section title if available
+            if table.section_title:
+                writer.writerow([f"Section: {table.section_title}"])
+
+            # Write table data
+            writer.writerows(table.data)
+
+        with open(
+            output_path, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as csvfile:
+            csvfile.write(buf.getvalue())
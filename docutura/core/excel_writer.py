@@ -4,10 +4,12 @@ Excel output engine for DocTura Desktop.
 Supports multiple layout modes and metadata sheet generation.
 """
 
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from openpyxl import Workbook
+from openpyxl.cell import Cell, WriteOnlyCell
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
@@ -17,12 +19,44 @@ from docutura.core.models import (
     ExcelLayoutMode,
     ExtractedTable,
     ValidationReport,
+    ValidationStatus,
 )
 from docutura.core.themes import Theme
+from docutura.core.xlsxwriter_backend import XLSXWRITER_AVAILABLE, XlsxWriterWorkbook
+
+# "auto" backend switches to xlsxwriter above this many table cells
+_XLSXWRITER_MIN_CELLS = 50_000
+
+# Column letters for every Excel column (A .. XFD)
+_COL_LETTERS = tuple(get_column_letter(i) for i in range(1, 16385))
+
+# Write buffer for the final zip; openpyxl would otherwise write in small chunks
+_SAVE_BUFFER_SIZE = 4 << 20
+
+
+def _column_widths(rows: Iterable[List], num_cols: int) -> List[int]:
+    """Compute auto-fit widths for the first num_cols columns of rows."""
+    max_lengths = [0] * num_cols
+    for row_data in rows:
+        for col_idx, value in enumerate(row_data[:num_cols]):
+            if value:
+                length = len(str(value))
+                if length > max_lengths[col_idx]:
+                    max_lengths[col_idx] = length
+
+    # Pad and cap at 50
+    return [min(length + 2, 50) for length in max_lengths]
 
 
 class ExcelWriter:
-    """Writes extracted tables to Excel with configurable layouts."""
+    """
+    Writes extracted tables to Excel with configurable layouts.
+
+    Instances hold configuration only and are reused across documents.
+    """
+
+    # Characters Excel does not allow in sheet names
+    _SHEET_NAME_TRANS = str.maketrans({c: "_" for c in "/\\:*?[]"})
 
     def __init__(
         self,
@@ -30,6 +64,8 @@ class ExcelWriter:
         add_borders: bool = True,
         freeze_headers: bool = True,
         theme: Optional[Theme] = None,
+        streaming: bool = False,
+        backend: str = "auto",
     ):
         """
         Initialize Excel writer.
@@ -39,11 +75,45 @@ class ExcelWriter:
             add_borders: Add borders to cells
             freeze_headers: Freeze header row
             theme: Theme for styling
+            streaming: Use a write-only workbook that streams rows to disk
+            backend: "openpyxl", "xlsxwriter", or "auto" (xlsxwriter for large
+                outputs when it is installed)
         """
         self.layout_mode = layout_mode
         self.add_borders = add_borders
         self.freeze_headers = freeze_headers
         self.theme = theme
+        self.streaming = streaming
+        self.backend = backend
+
+        # Shared style objects (openpyxl deduplicates styles by value)
+        if self.theme:
+            header_color = self.theme.palette.primary.replace("#", "")
+        else:
+            header_color = "0B1F3B"  # Corporate navy blue
+
+        self._header_font = Font(bold=True, color="FFFFFF")
+        self._header_fill = PatternFill(
+            start_color=header_color, end_color=header_color, fill_type="solid"
+        )
+        self._header_align = Alignment(horizontal="center", vertical="center")
+        self._thin_border = Border(
+            left=Side(style="thin"),
+            right=Side(style="thin"),
+            top=Side(style="thin"),
+            bottom=Side(style="thin"),
+        )
+        self._bold_font = Font(bold=True)
+        self._title_font = Font(bold=True, size=14)
+        self._section_title_font = Font(bold=True, size=12)
+        self._report_header_fill = PatternFill(
+            start_color="0B1F3B", end_color="0B1F3B", fill_type="solid"
+        )
+
+        # Validation severity fonts
+        self._font_passed = Font(color="1F7A1F", bold=True)
+        self._font_warning = Font(color="D97706", bold=True)
+        self._font_failed = Font(color="9B1C1C", bold=True)
 
     def write_to_excel(
         self,
@@ -63,7 +133,7 @@ class ExcelWriter:
             metadata: Document metadata
             validation_report: Validation report
         """
-        wb = Workbook()
+        wb = self._create_workbook(output_path, page_tables, logical_tables)
 
         # Remove default sheet
         if "Sheet" in wb.sheetnames:
@@ -91,8 +161,46 @@ class ExcelWriter:
         if validation_report:
             self._write_validation_sheet(wb, validation_report)
 
-        # Save workbook
-        wb.save(output_path)
+        # Save workbook through a large write buffer; a failed save leaves no
+        # truncated file behind
+        try:
+            if isinstance(wb, XlsxWriterWorkbook):
+                wb.save(output_path)  # xlsxwriter writes the zip itself
+            else:
+                with open(output_path, "wb", buffering=_SAVE_BUFFER_SIZE) as f:
+                    wb.save(f)
+        except Exception:
+            output_path.unlink(missing_ok=True)
+            raise
+
+    def _create_workbook(
+        self,
+        output_path: Path,
+        page_tables: List[ExtractedTable],
+        logical_tables: List[ExtractedTable],
+    ) -> Workbook:
+        """
+        Create a workbook for the configured backend.
+
+        Args:
+            output_path: Output file path
+            page_tables: Page-preserved tables
+            logical_tables: Logical tables
+
+        Returns:
+            openpyxl Workbook, or an xlsxwriter-backed workbook with the same interface
+        """
+        backend = self.backend
+        if backend == "auto":
+            total_cells = sum(
+                len(t.data) * t.schema.column_count for t in chain(page_tables, logical_tables)
+            )
+            use_xlsxwriter = XLSXWRITER_AVAILABLE and total_cells > _XLSXWRITER_MIN_CELLS
+            backend = "xlsxwriter" if use_xlsxwriter else "openpyxl"
+
+        if backend == "xlsxwriter":
+            return XlsxWriterWorkbook(output_path)
+        return Workbook(write_only=self.streaming)
 
     def _write_metadata_sheet(
         self, wb: Workbook, metadata: DocumentMetadata
@@ -100,23 +208,19 @@ class ExcelWriter:
         """Write Document_Metadata sheet."""
         ws = wb.create_sheet("Document_Metadata", 0)
 
-        # Write metadata as key-value pairs
-        data = metadata.to_worksheet_data()
-
-        for row_idx, (key, value) in enumerate(data, start=1):
-            ws.cell(row_idx, 1, key)
-            ws.cell(row_idx, 2, value)
-
-        # Style header column
-        for row_idx in range(1, len(data) + 1):
-            cell = ws.cell(row_idx, 1)
-            if cell.value and cell.value.strip():  # Not blank row
-                cell.font = Font(bold=True)
-
         # Set column widths
         ws.column_dimensions["A"].width = 25
         ws.column_dimensions["B"].width = 50
 
+        # Write metadata as key-value pairs, bolding the keys of non-blank rows
+        for key, value in metadata.to_worksheet_data():
+            if key and key.strip():
+                key_cell = WriteOnlyCell(ws, value=key)
+                key_cell.font = self._bold_font
+                ws.append([key_cell, value])
+            else:
+                ws.append([key, value])
+
     def _write_table_to_sheet(
         self, wb: Workbook, table: ExtractedTable, sheet_name: str
     ) -> Worksheet:
@@ -132,26 +236,18 @@ class ExcelWriter:
             Created worksheet
         """
         ws = wb.create_sheet(sheet_name)
+        num_cols = table.schema.column_count
 
-        # Write data
-        for row_idx, row_data in enumerate(table.data, start=1):
-            for col_idx, cell_value in enumerate(row_data, start=1):
-                ws.cell(row_idx, col_idx, cell_value)
-
-        # Style header row
-        if table.schema.has_header and table.data:
-            self._apply_header_style(ws, row=1, num_cols=table.schema.column_count)
-
-        # Apply borders
-        if self.add_borders and table.data:
-            self._apply_borders(ws, len(table.data), table.schema.column_count)
-
-        # Freeze header
+        # Sheet views and column widths must be set before rows are streamed
         if self.freeze_headers and table.schema.has_header:
             ws.freeze_panes = "A2"
 
-        # Auto-size columns
-        self._auto_size_columns(ws, table.schema.column_count)
+        self._set_column_widths(ws, _column_widths(table.data, num_cols))
+
+        # Write data, styling header and borders as each row is built
+        for row_idx, row_data in enumerate(table.data):
+            header_cols = num_cols if row_idx == 0 and table.schema.has_header else 0
+            ws.append(self._build_row(ws, row_data, num_cols, header_cols))
 
         return ws
 
@@ -170,43 +266,41 @@ class ExcelWriter:
         """Write all logical tables to a single worksheet, stacked vertically."""
         ws = wb.create_sheet("Logical_Tables")
 
-        current_row = 1
+        cols_per_table = [t.schema.column_count for t in tables]
+        last_idx = len(tables) - 1
+
+        # Borders span the widest table on every row, including titles and separators
+        max_cols = max(cols_per_table, default=0)
+
+        # Freeze first header
+        if self.freeze_headers and tables and tables[0].schema.has_header:
+            ws.freeze_panes = "A2"
+
+        # Auto-size columns from titles and data before any row is written
+        sized_rows = chain.from_iterable(
+            ([[t.section_title]] if t.section_title else []) + t.data for t in tables
+        )
+        self._set_column_widths(ws, _column_widths(sized_rows, max_cols))
+
+        append = ws.append
+        build_row = self._build_row
 
         for table_idx, table in enumerate(tables):
             # Add section title if available
             if table.section_title:
-                ws.cell(current_row, 1, table.section_title)
-                ws.cell(current_row, 1).font = Font(bold=True, size=12)
-                current_row += 1
+                title_cell = WriteOnlyCell(ws, value=table.section_title)
+                title_cell.font = self._section_title_font
+                append(build_row(ws, [title_cell], max_cols))
 
-            # Write table data
+            # Write table data, styling the header row of this table
+            header_cols = cols_per_table[table_idx] if table.schema.has_header else 0
             for row_data in table.data:
-                for col_idx, cell_value in enumerate(row_data, start=1):
-                    ws.cell(current_row, col_idx, cell_value)
-                current_row += 1
-
-            # Apply header style to first row of this table
-            if table.schema.has_header:
-                header_row = current_row - len(table.data)
-                self._apply_header_style(
-                    ws, row=header_row, num_cols=table.schema.column_count
-                )
+                append(build_row(ws, row_data, max_cols, header_cols))
+                header_cols = 0
 
             # Add blank row separator between tables
-            if table_idx < len(tables) - 1:
-                current_row += 1
-
-        # Apply borders to entire sheet
-        if self.add_borders:
-            self._apply_borders(ws, current_row - 1, max(t.schema.column_count for t in tables))
-
-        # Freeze first header
-        if self.freeze_headers and tables and tables[0].schema.has_header:
-            ws.freeze_panes = "A2"
-
-        # Auto-size columns
-        max_cols = max(t.schema.column_count for t in tables) if tables else 0
-        self._auto_size_columns(ws, max_cols)
+            if table_idx < last_idx:
+                append(build_row(ws, [], max_cols))
 
     def _write_logical_tables_single_horizontal(
         self, wb: Workbook, tables: List[ExtractedTable]
@@ -214,41 +308,50 @@ class ExcelWriter:
         """Write all logical tables to a single worksheet, placed horizontally."""
         ws = wb.create_sheet("Logical_Tables")
 
-        current_col = 1
-
-        for table_idx, table in enumerate(tables):
-            # Write table data
-            for row_idx, row_data in enumerate(table.data, start=1):
-                for col_offset, cell_value in enumerate(row_data):
-                    ws.cell(row_idx, current_col + col_offset, cell_value)
-
-            # Apply header style
-            if table.schema.has_header:
-                self._apply_header_style(
-                    ws,
-                    row=1,
-                    num_cols=table.schema.column_count,
-                    start_col=current_col,
-                )
-
-            # Apply borders to this table
-            if self.add_borders:
-                self._apply_borders(
-                    ws,
-                    len(table.data),
-                    table.schema.column_count,
-                    start_col=current_col,
-                )
-
-            # Move to next column position (with separator)
-            current_col += table.schema.column_count + 1
-
         # Freeze first header
         if self.freeze_headers and tables and tables[0].schema.has_header:
             ws.freeze_panes = "A2"
 
-        # Auto-size all columns
-        self._auto_size_columns(ws, current_col - 1)
+        # Auto-size each table's columns plus its separator column
+        widths = []
+        for table in tables:
+            widths.extend(_column_widths(table.data, table.schema.column_count + 1))
+        self._set_column_widths(ws, widths)
+
+        # Per-table (data, row count, column count, has header, pad to separator)
+        last_idx = len(tables) - 1
+        layout = [
+            (
+                t.data,
+                len(t.data),
+                t.schema.column_count,
+                t.schema.has_header,
+                table_idx < last_idx,
+            )
+            for table_idx, t in enumerate(tables)
+        ]
+        build_row = self._build_row
+
+        # Each output row joins row N of every table, with a blank separator column
+        num_rows = max((entry[1] for entry in layout), default=0)
+        for row_idx in range(num_rows):
+            row = []
+            for data, data_len, num_cols, has_header, pad in layout:
+                if row_idx < data_len:
+                    header_cols = num_cols if row_idx == 0 and has_header else 0
+                    segment = build_row(ws, data[row_idx], num_cols, header_cols)
+                else:
+                    segment = []
+
+                if pad:
+                    # Keep the next table aligned to its own columns
+                    segment = segment[: num_cols + 1]
+                    segment.extend([None] * (num_cols + 1 - len(segment)))
+                row.extend(segment)
+
+            while row and row[-1] is None:
+                row.pop()
+            ws.append(row)
 
     def _write_validation_sheet(
         self, wb: Workbook, report: ValidationReport
@@ -256,119 +359,113 @@ class ExcelWriter:
         """Write validation report to a worksheet."""
         ws = wb.create_sheet("Validation_Report")
 
-        # Summary section
-        ws.cell(1, 1, "Validation Summary")
-        ws.cell(1, 1).font = Font(bold=True, size=14)
+        # Column widths
+        ws.column_dimensions["A"].width = 15
+        ws.column_dimensions["B"].width = 20
+        ws.column_dimensions["C"].width = 8
+        ws.column_dimensions["D"].width = 15
+        ws.column_dimensions["E"].width = 60
 
-        ws.cell(3, 1, "Overall Status")
-        ws.cell(3, 2, report.overall_status.value.upper())
+        # Summary section
+        title_cell = WriteOnlyCell(ws, value="Validation Summary")
+        title_cell.font = self._title_font
+        ws.append([title_cell])
+        ws.append([])
 
-        status_cell = ws.cell(3, 2)
+        status_cell = WriteOnlyCell(ws, value=report.overall_status.value.upper())
         if report.overall_status.value == "passed":
-            status_cell.font = Font(color="1F7A1F", bold=True)
+            status_cell.font = self._font_passed
         elif report.overall_status.value == "warning":
-            status_cell.font = Font(color="D97706", bold=True)
+            status_cell.font = self._font_warning
         else:
-            status_cell.font = Font(color="9B1C1C", bold=True)
+            status_cell.font = self._font_failed
+        ws.append(["Overall Status", status_cell])
 
-        ws.cell(4, 1, "Tables Validated")
-        ws.cell(4, 2, report.tables_validated)
-
-        ws.cell(5, 1, "Tables Passed")
-        ws.cell(5, 2, report.tables_passed)
-
-        ws.cell(6, 1, "Tables with Warnings")
-        ws.cell(6, 2, report.tables_with_warnings)
-
-        ws.cell(7, 1, "Tables Failed")
-        ws.cell(7, 2, report.tables_failed)
+        ws.append(["Tables Validated", report.tables_validated])
+        ws.append(["Tables Passed", report.tables_passed])
+        ws.append(["Tables with Warnings", report.tables_with_warnings])
+        ws.append(["Tables Failed", report.tables_failed])
 
         # Issues section
         if report.issues:
-            ws.cell(9, 1, "Validation Issues")
-            ws.cell(9, 1).font = Font(bold=True, size=12)
+            ws.append([])
+
+            section_cell = WriteOnlyCell(ws, value="Validation Issues")
+            section_cell.font = self._section_title_font
+            ws.append([section_cell])
 
             # Headers
             headers = ["Severity", "Table", "Row", "Column", "Message"]
-            for col_idx, header in enumerate(headers, start=1):
-                cell = ws.cell(10, col_idx, header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="0B1F3B", end_color="0B1F3B", fill_type="solid")
-                cell.font = Font(color="FFFFFF", bold=True)
-
-            # Issues
-            for issue_idx, issue in enumerate(report.issues, start=11):
-                ws.cell(issue_idx, 1, issue.severity.value.upper())
-                ws.cell(issue_idx, 2, issue.table_name)
-                ws.cell(issue_idx, 3, issue.row_index if issue.row_index is not None else "")
-                ws.cell(issue_idx, 4, issue.column_name or "")
-                ws.cell(issue_idx, 5, issue.message)
-
-                # Color code severity
-                severity_cell = ws.cell(issue_idx, 1)
-                if issue.severity == "failed":
-                    severity_cell.font = Font(color="9B1C1C", bold=True)
-                elif issue.severity == "warning":
-                    severity_cell.font = Font(color="D97706", bold=True)
-
-        # Auto-size columns
-        ws.column_dimensions["A"].width = 15
-        ws.column_dimensions["B"].width = 20
-        ws.column_dimensions["C"].width = 8
-        ws.column_dimensions["D"].width = 15
-        ws.column_dimensions["E"].width = 60
-
-    def _apply_header_style(
-        self, ws: Worksheet, row: int, num_cols: int, start_col: int = 1
-    ) -> None:
-        """Apply header styling to a row."""
-        # Get theme colors or use defaults
-        if self.theme:
-            header_color = self.theme.palette.primary.replace("#", "")
-        else:
-            header_color = "0B1F3B"  # Corporate navy blue
-
-        for col_idx in range(start_col, start_col + num_cols):
-            cell = ws.cell(row, col_idx)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(
-                start_color=header_color, end_color=header_color, fill_type="solid"
-            )
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    def _apply_borders(
-        self,
-        ws: Worksheet,
-        num_rows: int,
-        num_cols: int,
-        start_row: int = 1,
-        start_col: int = 1,
-    ) -> None:
-        """Apply borders to table range."""
-        thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-
-        for row_idx in range(start_row, start_row + num_rows):
-            for col_idx in range(start_col, start_col + num_cols):
-                ws.cell(row_idx, col_idx).border = thin_border
-
-    def _auto_size_columns(self, ws: Worksheet, num_cols: int) -> None:
-        """Auto-size columns based on content."""
-        for col_idx in range(1, num_cols + 1):
-            column_letter = get_column_letter(col_idx)
+            header_cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.fill = self._report_header_fill
+                cell.font = self._header_font
+                header_cells.append(cell)
+            ws.append(header_cells)
+
+            # Issues, with the severity cell color coded as each row is built
+            severity_fonts = {
+                ValidationStatus.FAILED: self._font_failed,
+                ValidationStatus.WARNING: self._font_warning,
+            }
+            for issue in report.issues:
+                severity_cell = WriteOnlyCell(ws, value=issue.severity.value.upper())
+                severity_font = severity_fonts.get(issue.severity)
+                if severity_font is not None:
+                    severity_cell.font = severity_font
+
+                ws.append([
+                    severity_cell,
+                    issue.table_name,
+                    issue.row_index if issue.row_index is not None else "",
+                    issue.column_name or "",
+                    issue.message,
+                ])
+
+    def _build_row(
+        self, ws: Worksheet, row_data: List, num_cols: int, header_cols: int = 0
+    ) -> List:
+        """
+        Build a row for ws.append, styling cells as they are created.
 
-            max_length = 0
-            for cell in ws[column_letter]:
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
+        Args:
+            ws: Worksheet the row belongs to
+            row_data: Cell values (or prebuilt cells)
+            num_cols: Number of cells to border (when borders are enabled)
+            header_cols: Number of cells to style as header
 
-            # Set width with some padding
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50
-            ws.column_dimensions[column_letter].width = adjusted_width
+        Returns:
+            Row of values and styled cells
+        """
+        border_cols = num_cols if self.add_borders else 0
+        styled_cols = max(border_cols, header_cols)
+        if not styled_cols:
+            return list(row_data)
+
+        row = []
+        for col_idx in range(max(styled_cols, len(row_data))):
+            value = row_data[col_idx] if col_idx < len(row_data) else None
+            if col_idx >= styled_cols:
+                row.append(value)
+                continue
+
+            cell = value if isinstance(value, Cell) else WriteOnlyCell(ws, value=value)
+            if col_idx < header_cols:
+                cell.font = self._header_font
+                cell.fill = self._header_fill
+                cell.alignment = self._header_align
+            if col_idx < border_cols:
+                cell.border = self._thin_border
+            row.append(cell)
+
+        return row
+
+    @staticmethod
+    def _set_column_widths(ws: Worksheet, widths: List[int]) -> None:
+        """Set column widths starting at column A."""
+        for col_idx, width in enumerate(widths, start=1):
+            ws.column_dimensions[_COL_LETTERS[col_idx - 1]].width = width
 
     def _generate_sheet_name(
         self, table: ExtractedTable, index: int
@@ -392,9 +489,7 @@ class ExcelWriter:
             name = f"Logical_Table_{index}"
 
         # Clean name (Excel doesn't allow certain characters)
-        name = name.replace("/", "_").replace("\\", "_").replace(":", "_")
-        name = name.replace("*", "_").replace("?", "_").replace("[", "_")
-        name = name.replace("]", "_")
+        name = name.translate(self._SHEET_NAME_TRANS)
 
         # Truncate to 31 characters (Excel limit)
         return name[:31]
@@ -5,8 +5,12 @@ Handles PDF, DOCX, and image file ingestion with OCR support.
 """
 
 import io
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import pdfplumber
 from PIL import Image
@@ -21,13 +25,62 @@ except ImportError:
 
 from docutura.core.models import ExtractedTable, SegmentationStrategy, TableSchema
 
+# File extension -> file type
+_SUFFIX_MAP = {
+    ".pdf": "pdf",
+    ".docx": "docx",
+    ".doc": "docx",
+    ".png": "image",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".tiff": "image",
+    ".tif": "image",
+    ".wav": "audio",
+    ".mp3": "audio",
+    ".m4a": "audio",
+}
+
+
+# OCR threads shared by all extractors; tesseract runs as a subprocess, so threads
+# only wait on it, and sharing caps the processes concurrent conversions start
+_OCR_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Rendered pages allowed to wait for OCR before rendering pauses
+_OCR_MAX_PENDING = 2 * _OCR_MAX_WORKERS
+
+_ocr_pool: Optional[ThreadPoolExecutor] = None
+_ocr_pool_lock = threading.Lock()
+
+
+def _get_ocr_pool() -> ThreadPoolExecutor:
+    """Get the shared OCR thread pool, creating it on first use."""
+    global _ocr_pool
+
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = ThreadPoolExecutor(
+                max_workers=_OCR_MAX_WORKERS, thread_name_prefix="docutura-ocr"
+            )
+        return _ocr_pool
+
 
 class DocumentExtractor:
     """Main extraction engine for documents."""
 
-    def __init__(self, enable_ocr: bool = False, ocr_language: str = "eng"):
+    def __init__(self, enable_ocr: bool = False, ocr_language: str = "eng", ocr_dpi: int = 150):
+        """
+        Initialize extractor.
+
+        Args:
+            enable_ocr: Allow OCR for scanned PDFs and images
+            ocr_language: Tesseract language code
+            ocr_dpi: Rendering resolution for OCR'd PDF pages. 150 DPI grayscale
+                keeps body-text accuracy while OCR'ing roughly half the pixels of
+                the 200 DPI RGB default; raise it for very small print.
+        """
         self.enable_ocr = enable_ocr
         self.ocr_language = ocr_language
+        self.ocr_dpi = ocr_dpi
 
         if enable_ocr and not PYTESSERACT_AVAILABLE:
             raise ImportError(
@@ -44,18 +97,7 @@ class DocumentExtractor:
         Returns:
             File type: 'pdf', 'docx', 'image', 'audio', or 'unknown'
         """
-        suffix = file_path.suffix.lower()
-
-        if suffix == ".pdf":
-            return "pdf"
-        elif suffix in [".docx", ".doc"]:
-            return "docx"
-        elif suffix in [".png", ".jpg", ".jpeg", ".tiff", ".tif"]:
-            return "image"
-        elif suffix in [".wav", ".mp3", ".m4a"]:
-            return "audio"
-        else:
-            return "unknown"
+        return _SUFFIX_MAP.get(file_path.suffix.lower(), "unknown")
 
     def needs_ocr(self, file_path: Path) -> bool:
         """
@@ -78,13 +120,67 @@ class DocumentExtractor:
             try:
                 reader = PdfReader(str(file_path))
                 if len(reader.pages) > 0:
-                    text = reader.pages[0].extract_text()
+                    page = reader.pages[0]
+
+                    # Cheap sniff first: without fonts there is no text layer
+                    if not self._page_may_have_text(page):
+                        return True
+
+                    text = page.extract_text()
                     return len(text.strip()) < 50  # Arbitrary threshold
             except Exception:
                 return True
 
         return False
 
+    @staticmethod
+    def _page_may_have_text(page: Any) -> bool:
+        """
+        Check a PDF page's resources for fonts without extracting its text.
+
+        Args:
+            page: pypdf page object
+
+        Returns:
+            False if the page cannot contain extractable text
+        """
+        resources = page.get("/Resources")
+        if resources is None:
+            return False
+        resources = resources.get_object()
+
+        if resources.get("/Font"):
+            return True
+
+        # Text may also live in form XObjects carrying their own fonts
+        xobjects = resources.get("/XObject")
+        if xobjects:
+            for xobject in xobjects.get_object().values():
+                if xobject.get_object().get("/Subtype") == "/Form":
+                    return True
+
+        return False
+
+    def iter_pdf(self, file_path: Path) -> Iterator[Tuple[int, str, List[List[List[Any]]]]]:
+        """
+        Iterate over PDF pages, releasing each page's cached objects once read.
+
+        Args:
+            file_path: Path to PDF file
+
+        Yields:
+            Tuples of (page_num, text, raw_tables)
+        """
+        with pdfplumber.open(str(file_path)) as pdf:
+            for page_num, page in enumerate(pdf.pages, start=1):
+                text = page.extract_text() or ""
+                tables = page.extract_tables()
+
+                # pdfplumber caches chars/lines per page; drop them before the next page
+                page.close()
+
+                yield page_num, text, tables
+
     def extract_from_pdf(self, file_path: Path) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         Extract tables and text from PDF.
@@ -98,29 +194,23 @@ class DocumentExtractor:
         tables_data = []
         page_texts = []
 
-        with pdfplumber.open(str(file_path)) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
-                # Extract text
-                text = page.extract_text() or ""
-                page_texts.append(text)
-
-                # Extract tables using pdfplumber
-                tables = page.extract_tables()
+        for page_num, text, tables in self.iter_pdf(file_path):
+            page_texts.append(text)
 
-                for table_idx, table in enumerate(tables):
-                    if table and len(table) > 0:
-                        # Clean table data
-                        cleaned_table = self._clean_table_data(table)
-
-                        if cleaned_table:
-                            tables_data.append(
-                                {
-                                    "data": cleaned_table,
-                                    "page": page_num,
-                                    "table_index": table_idx,
-                                    "source": "pdfplumber",
-                                }
-                            )
+            for table_idx, table in enumerate(tables):
+                if table and len(table) > 0:
+                    # Clean table data
+                    cleaned_table = self._clean_table_data(table)
+
+                    if cleaned_table:
+                        tables_data.append(
+                            {
+                                "data": cleaned_table,
+                                "page": page_num,
+                                "table_index": table_idx,
+                                "source": "pdfplumber",
+                            }
+                        )
 
         return tables_data, page_texts
 
@@ -139,22 +229,33 @@ class DocumentExtractor:
         if not PYTESSERACT_AVAILABLE:
             raise ImportError("pytesseract is required for OCR")
 
-        from pdf2image import convert_from_path
+        import pypdfium2 as pdfium
 
         tables_data = []
-        page_texts = []
+        pool = _get_ocr_pool()
+        futures = []
+
+        # Pages are rendered here from one open document (pdfium is not thread-safe)
+        # while earlier pages are OCR'd on the shared pool
+        pdf = pdfium.PdfDocument(str(file_path))
+        try:
+            for page_index in range(len(pdf)):
+                image = pdf[page_index].render(scale=self.ocr_dpi / 72, grayscale=True).to_pil()
+                futures.append(
+                    pool.submit(pytesseract.image_to_string, image, lang=self.ocr_language)
+                )
 
-        # Convert PDF to images
-        images = convert_from_path(str(file_path))
+                # Bound the rendered images held in memory
+                if page_index >= _OCR_MAX_PENDING:
+                    futures[page_index - _OCR_MAX_PENDING].result()
+        finally:
+            pdf.close()
 
-        for page_num, image in enumerate(images, start=1):
-            # Perform OCR
-            text = pytesseract.image_to_string(image, lang=self.ocr_language)
-            page_texts.append(text)
+        page_texts = [future.result() for future in futures]
 
-            # For now, we don't extract tables from OCR
-            # This would require more sophisticated table detection
-            # Future enhancement: use table detection ML models
+        # For now, we don't extract tables from OCR
+        # This would require more sophisticated table detection
+        # Future enhancement: use table detection ML models
 
         return tables_data, page_texts
 
@@ -232,24 +333,26 @@ class DocumentExtractor:
             return []
 
         cleaned = []
+        append = cleaned.append
 
         for row in table:
             if not row:
                 continue
 
-            # Clean cell values
-            cleaned_row = []
-            for cell in row:
-                if cell is None:
-                    cleaned_row.append("")
-                elif isinstance(cell, str):
-                    cleaned_row.append(cell.strip())
-                else:
-                    cleaned_row.append(str(cell).strip())
+            # Clean cell values; all-string rows strip entirely inside C builtins
+            try:
+                cleaned_row = list(map(str.strip, row))
+            except TypeError:
+                cleaned_row = [
+                    ""
+                    if cell is None
+                    else (cell.strip() if cell.__class__ is str else str(cell).strip())
+                    for cell in row
+                ]
 
             # Skip completely empty rows
-            if any(cell for cell in cleaned_row):
-                cleaned.append(cleaned_row)
+            if any(cleaned_row):
+                append(cleaned_row)
 
         return cleaned
 
@@ -265,40 +368,38 @@ class DocumentExtractor:
         Returns:
             List of page-preserved ExtractedTable objects
         """
-        page_tables_dict: Dict[int, List[List[Any]]] = {}
+        page_tables_dict: Dict[int, List[List[Any]]] = defaultdict(list)
 
         # Group tables by page
         for table_dict in tables_data:
-            page = table_dict["page"]
             data = table_dict["data"]
-
-            if page not in page_tables_dict:
-                page_tables_dict[page] = []
+            page_rows = page_tables_dict[table_dict["page"]]
 
             # Merge multiple tables from same page
-            if page_tables_dict[page]:
+            if page_rows:
                 # Add a blank row separator
-                page_tables_dict[page].append([""] * len(data[0]))
+                page_rows.append([""] * len(data[0]))
 
-            page_tables_dict[page].extend(data)
+            page_rows.extend(data)
 
         # Convert to ExtractedTable objects
         page_tables = []
-        for page_num in sorted(page_tables_dict.keys()):
+        for page_num in sorted(page_tables_dict):
             data = page_tables_dict[page_num]
 
             if data:
-                # Try to detect headers (first row with all non-empty cells)
-                has_header = False
-                headers = []
+                first_row = data[0]
 
-                if data and all(cell.strip() for cell in data[0]):
-                    has_header = True
-                    headers = data[0]
+                # Try to detect headers (first row with all non-empty cells)
+                has_header = all(cell.strip() for cell in first_row)
 
                 schema = TableSchema(
-                    headers=headers if headers else [f"Column_{i+1}" for i in range(len(data[0]))],
-                    column_count=len(data[0]) if data else 0,
+                    headers=(
+                        first_row
+                        if has_header
+                        else [f"Column_{i+1}" for i in range(len(first_row))]
+                    ),
+                    column_count=len(first_row),
                     has_header=has_header,
                     header_row_indices=[0] if has_header else [],
                 )
@@ -1,16 +1,19 @@
 """
 Core data models for DocTura Desktop.
 
-Defines extraction options, table structures, validation reports, and metadata.
+Defines table structures, validation reports, and metadata. Extraction options
+live in docutura.core.options and are re-exported here on first access.
 """
 
+import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+if TYPE_CHECKING:
+    from docutura.core.options import ExtractionOptions
 
 
 class ExtractionMode(str, Enum):
@@ -61,9 +64,14 @@ class ValidationStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScoreDomain:
-    """Score domain definition for statistical distributions."""
+    """
+    Score domain definition for statistical distributions.
+
+    Immutable so plugins can share module-level instances; equality and hashing
+    are by value.
+    """
 
     name: str  # e.g., "Scaled Objective", "Scaled Essay"
     min_score: int
@@ -71,7 +79,7 @@ class ScoreDomain:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TableSchema:
     """Schema definition for extracted tables."""
 
@@ -81,7 +89,7 @@ class TableSchema:
     header_row_indices: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedTable:
     """Represents an extracted table (page-preserved or logical)."""
 
@@ -104,7 +112,7 @@ class ExtractedTable:
         return len(self.data) == 0
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutedTables:
     """Container for both page-preserved and logical tables."""
 
@@ -113,63 +121,51 @@ class RoutedTables:
 
     def get_all_tables(self, mode: ExtractionMode) -> List[ExtractedTable]:
         """Get tables based on extraction mode."""
-        if mode == ExtractionMode.HYBRID:
-            return self.page_tables + self.logical_tables
-        elif mode == ExtractionMode.PAGE_ONLY:
-            return self.page_tables
-        elif mode == ExtractionMode.LOGICAL_ONLY:
-            return self.logical_tables
-        return []
-
-
-class ExtractionOptions(BaseModel):
-    """User-configurable extraction and output options."""
-
-    # Extraction settings
-    mode: ExtractionMode = ExtractionMode.HYBRID
-    enable_ocr: bool = False
-    ocr_language: str = "eng"
-
-    # Output formats
-    output_formats: List[OutputFormat] = Field(default_factory=lambda: [OutputFormat.XLSX])
-
-    # Excel layout options
-    excel_layout: ExcelLayoutMode = ExcelLayoutMode.SEPARATE_SHEETS
-    excel_add_borders: bool = True
-    excel_freeze_headers: bool = True
-
-    # Word layout options
-    word_orientation: WordOrientation = WordOrientation.PORTRAIT
-    word_page_break_per_table: bool = False
-    word_include_images: bool = True
-
-    # PDF export (reverse conversion)
-    pdf_fit_to_width: bool = True
-    pdf_include_gridlines: bool = False
-
-    # Metadata
-    metadata_sheet_enabled: bool = True
-    metadata_policy: str = "sheet_only"  # "sheet_only" or "duplicate"
-
-    # Validation
-    validation_enabled: bool = True
-    validation_tolerance: float = 0.01  # For percent totals
-
-    # AI summarization (optional)
-    ai_summary_enabled: bool = False
-    ai_provider: Optional[str] = None  # "anthropic" or "openai"
-
-    # Theme
-    theme: str = "corporate"  # "corporate" or "indigenous"
-
-    # Audit logging
-    audit_logging_enabled: bool = True
-
-    class Config:
-        use_enum_values = True
-
-
-@dataclass
+        route = _ROUTE.get(mode)
+        return route(self) if route else []
+
+
+# Tables returned for each extraction mode (also matches plain-string modes)
+_ROUTE = {
+    ExtractionMode.HYBRID: lambda routed: routed.page_tables + routed.logical_tables,
+    ExtractionMode.PAGE_ONLY: lambda routed: routed.page_tables,
+    ExtractionMode.LOGICAL_ONLY: lambda routed: routed.logical_tables,
+}
+
+
+# Read size for the pre-3.11 hashing fallback
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Overall status after adding an issue, keyed by (current status, issue severity)
+_STATUS_UPGRADE = {
+    (current, severity): (
+        ValidationStatus.FAILED
+        if ValidationStatus.FAILED in (current, severity)
+        else ValidationStatus.WARNING
+        if ValidationStatus.WARNING in (current, severity)
+        else current
+    )
+    for current in ValidationStatus
+    for severity in ValidationStatus
+}
+
+# Serialized value of each validation status (also matches plain-string statuses)
+_SEV_MAP = {status: status.value for status in ValidationStatus}
+
+# Metadata sheet rows shown as-is, or "N/A" when unset
+_IDENTIFICATION_ROWS = (
+    ("Document Title", "title"),
+    ("Organization", "organization"),
+    ("Reporting Period", "reporting_period"),
+    ("Subject/Code", "subject_or_code"),
+)
+_PLUGIN_ROWS = (
+    ("Plugin ID", "plugin_id"),
+    ("Plugin Version", "plugin_version"),
+)
+
+
+@dataclass(slots=True)
 class ValidationIssue:
     """A single validation issue."""
 
@@ -181,7 +177,7 @@ class ValidationIssue:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationReport:
     """Complete validation report for a document."""
 
@@ -198,26 +194,38 @@ class ValidationReport:
         self.issues.append(issue)
 
         # Update overall status
-        if issue.severity == ValidationStatus.FAILED:
-            self.overall_status = ValidationStatus.FAILED
-        elif issue.severity == ValidationStatus.WARNING and self.overall_status != ValidationStatus.FAILED:
-            self.overall_status = ValidationStatus.WARNING
+        current = self.overall_status
+        self.overall_status = _STATUS_UPGRADE.get((current, issue.severity), current)
+
+    def add_issues(self, issues: List[ValidationIssue]) -> None:
+        """Add a batch of validation issues, updating the overall status once."""
+        self.issues.extend(issues)
+
+        status = self.overall_status
+        for issue in issues:
+            status = _STATUS_UPGRADE.get((status, issue.severity), status)
+        self.overall_status = status
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "overall_status": self.overall_status.value,
-            "issues": [
+        sev_map = _SEV_MAP
+        issues = []
+        append = issues.append
+        for issue in self.issues:
+            append(
                 {
-                    "severity": issue.severity.value,
+                    "severity": sev_map[issue.severity],
                     "message": issue.message,
                     "table_name": issue.table_name,
                     "row_index": issue.row_index,
                     "column_name": issue.column_name,
                     "details": issue.details,
                 }
-                for issue in self.issues
-            ],
+            )
+
+        return {
+            "overall_status": sev_map[self.overall_status],
+            "issues": issues,
             "summary": {
                 "tables_validated": self.tables_validated,
                 "tables_passed": self.tables_passed,
@@ -228,7 +236,7 @@ class ValidationReport:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentMetadata:
     """Metadata extracted from document."""
 
@@ -257,17 +265,39 @@ class DocumentMetadata:
     validation_status: Optional[str] = None
     validation_issues_count: int = 0
 
+    @staticmethod
+    def compute_hash(file_path: Path) -> str:
+        """
+        Compute the SHA-256 hash of a file.
+
+        Args:
+            file_path: File to hash
+
+        Returns:
+            Hex digest
+        """
+        with open(file_path, "rb") as f:
+            # Python 3.11+: hashes in C with large buffers and releases the GIL
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            sha256 = hashlib.sha256()
+            buf = bytearray(_HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+
+            while n := f.readinto(buf):
+                sha256.update(view[:n])
+
+        return sha256.hexdigest()
+
     def to_worksheet_data(self) -> List[Tuple[str, Any]]:
         """Convert to list of (key, value) pairs for Excel sheet."""
-        return [
-            ("Document Title", self.title or "N/A"),
-            ("Organization", self.organization or "N/A"),
-            ("Reporting Period", self.reporting_period or "N/A"),
-            ("Subject/Code", self.subject_or_code or "N/A"),
-            ("", ""),  # Blank row
-            ("Plugin ID", self.plugin_id or "N/A"),
-            ("Plugin Version", self.plugin_version or "N/A"),
-            ("Plugin Confidence", f"{self.plugin_confidence:.2%}"),
+        rows = [(label, getattr(self, attr) or "N/A") for label, attr in _IDENTIFICATION_ROWS]
+        rows.append(("", ""))  # Blank row
+        rows.extend((label, getattr(self, attr) or "N/A") for label, attr in _PLUGIN_ROWS)
+        confidence = self.plugin_confidence
+        rows += [
+            ("Plugin Confidence", f"{confidence:.2%}" if confidence else "0.00%"),
             ("", ""),  # Blank row
             ("Extraction Mode", self.extraction_mode),
             ("Excel Layout", self.excel_layout_mode or "N/A"),
@@ -282,9 +312,10 @@ class DocumentMetadata:
             ("Validation Status", self.validation_status or "N/A"),
             ("Validation Issues", self.validation_issues_count),
         ]
+        return rows
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionResult:
     """Result of a document conversion operation."""
 
@@ -301,5 +332,14 @@ class ConversionResult:
         if not self.success:
             return f"Failed: {self.error_message}"
 
-        formats = ", ".join([f.suffix.upper()[1:] for f in self.output_files])
+        formats = ", ".join([f.suffix[1:].upper() for f in self.output_files])
         return f"Success: Generated {len(self.output_files)} file(s) ({formats}) in {self.processing_time_seconds:.2f}s"
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ExtractionOptions lazily so importing models does not load pydantic."""
+    if name == "ExtractionOptions":
+        from docutura.core.options import ExtractionOptions
+
+        return ExtractionOptions
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
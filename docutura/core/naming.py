@@ -5,12 +5,23 @@ Generates intelligent output file names based on document metadata.
 """
 
 import re
-from datetime import datetime
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from docutura.core.models import DocumentMetadata, OutputFormat
 
+# Characters not allowed in file names (deleted)
+_INVALID_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+
+# Runs of whitespace and/or underscores (collapsed to one underscore)
+_SEPARATOR_RE = re.compile(r"[\s_]+")
+
+# Name part added for known plugin families ("waec" wins when both appear)
+_PLUGIN_HINTS = {"waec": "WAEC", "staff": "Staff_List"}
+_PLUGIN_HINT_RE = re.compile(r"waec|staff(?!.*waec)", re.IGNORECASE | re.DOTALL)
+
 
 class SmartNamingEngine:
     """Generates smart output file names."""
@@ -51,10 +62,9 @@ class SmartNamingEngine:
 
             # Add plugin hint
             if metadata.plugin_id:
-                if "waec" in metadata.plugin_id.lower():
-                    parts.append("WAEC")
-                elif "staff" in metadata.plugin_id.lower():
-                    parts.append("Staff_List")
+                hint = _PLUGIN_HINT_RE.search(metadata.plugin_id)
+                if hint:
+                    parts.append(_PLUGIN_HINTS[hint.group().lower()])
 
         # If no metadata, use input file name (without extension)
         if not parts:
@@ -86,7 +96,10 @@ class SmartNamingEngine:
         Returns:
             Directory name
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        t = time.localtime()
+        timestamp = (
+            f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
+        )
 
         if metadata and metadata.subject_or_code:
             base = self._sanitize(metadata.subject_or_code)
@@ -96,6 +109,7 @@ class SmartNamingEngine:
         return f"{base}_{timestamp}"
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _sanitize(name: str) -> str:
         """
         Sanitize file name.
@@ -106,12 +120,8 @@ class SmartNamingEngine:
         Returns:
             Sanitized name
         """
-        # Remove or replace invalid characters
-        name = re.sub(r'[<>:"/\\|?*]', "", name)
-
-        # Replace spaces and multiple underscores
-        name = re.sub(r"\s+", "_", name)
-        name = re.sub(r"_+", "_", name)
+        # Remove invalid characters, then replace spaces and multiple underscores
+        name = _SEPARATOR_RE.sub("_", name.translate(_INVALID_CHARS))
 
         # Trim underscores
         name = name.strip("_")
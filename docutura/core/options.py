@@ -0,0 +1,63 @@
+"""
+Extraction options model for DocTura Desktop.
+
+Kept apart from the core data models because pydantic is only needed once
+options are built; re-exported lazily as docutura.core.models.ExtractionOptions.
+"""
+
+from typing import List, Optional
+
+from pydantic import ConfigDict, Field
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+from docutura.core.models import ExcelLayoutMode, ExtractionMode, OutputFormat, WordOrientation
+
+
+@pydantic_dataclass(slots=True, config=ConfigDict(use_enum_values=True))
+class ExtractionOptions:
+    """User-configurable extraction and output options."""
+
+    # Extraction settings
+    mode: ExtractionMode = ExtractionMode.HYBRID
+    enable_ocr: bool = False
+    ocr_language: str = "eng"
+
+    # Output formats
+    output_formats: List[OutputFormat] = Field(default_factory=lambda: [OutputFormat.XLSX])
+
+    # Excel layout options
+    excel_layout: ExcelLayoutMode = ExcelLayoutMode.SEPARATE_SHEETS
+    excel_add_borders: bool = True
+    excel_freeze_headers: bool = True
+    excel_streaming: bool = False  # Write-only workbook for very large tables
+    excel_backend: str = "auto"  # "openpyxl", "xlsxwriter", or "auto"
+
+    # Word layout options
+    word_orientation: WordOrientation = WordOrientation.PORTRAIT
+    word_page_break_per_table: bool = False
+    word_include_images: bool = True
+
+    # PDF export (reverse conversion)
+    pdf_fit_to_width: bool = True
+    pdf_include_gridlines: bool = False
+
+    # Metadata
+    metadata_sheet_enabled: bool = True
+    metadata_policy: str = "sheet_only"  # "sheet_only" or "duplicate"
+
+    # Validation
+    validation_enabled: bool = True
+    validation_tolerance: float = 0.01  # For percent totals
+
+    # AI summarization (optional)
+    ai_summary_enabled: bool = False
+    ai_provider: Optional[str] = None  # "anthropic" or "openai"
+
+    # Theme
+    theme: str = "corporate"  # "corporate" or "indigenous"
+
+    # Audit logging
+    audit_logging_enabled: bool = True
+
+    # Reuse cached extraction/validation results for unchanged inputs
+    cache_enabled: bool = True
@@ -6,6 +6,10 @@ to prevent page-boundary truncation issues.
 """
 
 import re
+import sys
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain
 from typing import Any, Dict, List, Optional, Tuple
 
 from docutura.core.models import (
@@ -15,6 +19,15 @@ from docutura.core.models import (
     TableSchema,
 )
 
+# Finite decimal numbers (commas and surrounding whitespace already removed)
+_NUM_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+# Segmenter method implementing each concrete strategy
+_STRATEGY_DISPATCH: Dict[SegmentationStrategy, str] = {
+    SegmentationStrategy.SCORE_DOMAIN: "segment_by_score_domain",
+    SegmentationStrategy.HEADER_REPETITION: "segment_by_header_repetition",
+}
+
 
 class TableSegmenter:
     """
@@ -23,12 +36,6 @@ class TableSegmenter:
     This is critical to prevent the TASS Scaled Essay truncation incident.
     """
 
-    def __init__(self):
-        self.strategies = {
-            SegmentationStrategy.SCORE_DOMAIN: self.segment_by_score_domain,
-            SegmentationStrategy.HEADER_REPETITION: self.segment_by_header_repetition,
-        }
-
     def segment_tables(
         self,
         all_tables: List[Dict[str, Any]],
@@ -50,11 +57,11 @@ class TableSegmenter:
             # Try to detect which strategy to use
             strategy = self._detect_strategy(all_tables)
 
-        handler = self.strategies.get(strategy)
-        if not handler:
+        handler_name = _STRATEGY_DISPATCH.get(strategy)
+        if not handler_name:
             raise ValueError(f"Unknown segmentation strategy: {strategy}")
 
-        return handler(all_tables, score_domains=score_domains)
+        return getattr(self, handler_name)(all_tables, score_domains=score_domains)
 
     def _detect_strategy(
         self, all_tables: List[Dict[str, Any]]
@@ -74,9 +81,7 @@ class TableSegmenter:
             data = table_dict.get("data", [])
             if data and len(data) > 1:
                 first_col_values = [row[0] for row in data[1:] if row]
-                numeric_count = sum(
-                    1 for val in first_col_values if self._is_numeric(val)
-                )
+                numeric_count = sum(map(self._is_numeric, first_col_values))
                 if numeric_count > len(first_col_values) * 0.7:  # 70% numeric
                     has_score_column = True
                     break
@@ -120,16 +125,8 @@ class TableSegmenter:
             score_domains = self._detect_score_domains(all_tables)
 
         # Merge all data first (ignore page boundaries)
-        merged_data = []
-        source_pages = []
-
-        for table_dict in all_tables:
-            data = table_dict.get("data", [])
-            page = table_dict.get("page", 1)
-
-            merged_data.extend(data)
-            if page not in source_pages:
-                source_pages.append(page)
+        merged_data = list(chain.from_iterable(t.get("data", ()) for t in all_tables))
+        source_pages = sorted({t.get("page", 1) for t in all_tables})
 
         if not merged_data:
             return []
@@ -141,33 +138,31 @@ class TableSegmenter:
         # Find score column (usually first column)
         score_col_idx = 0  # Default to first column
 
-        # Segment by score domains
-        segmented_tables = []
-
-        for domain in score_domains:
-            domain_rows = []
-
-            for row in data_rows:
-                if not row or len(row) <= score_col_idx:
-                    continue
+        # Parse each row's score once, rather than once per domain
+        extract_number = self._extract_number
+        scored_rows = []
+        for row in data_rows:
+            if not row or len(row) <= score_col_idx:
+                continue
 
-                score_val = row[score_col_idx]
-                score_num = self._extract_number(score_val)
+            score_num = extract_number(row[score_col_idx])
+            if score_num is not None:
+                scored_rows.append((score_num, row))
 
-                if score_num is not None and domain.min_score <= score_num <= domain.max_score:
-                    domain_rows.append(row)
+        # Segment by score domains (all domain tables share the merged header's schema)
+        segmented_tables = []
+        schema = TableSchema(
+            headers=header,
+            column_count=len(header),
+            has_header=True,
+            header_row_indices=[0],
+        )
 
+        for domain, domain_rows in zip(score_domains, self._bucket_by_domain(scored_rows, score_domains)):
             if domain_rows:
                 # Create table for this domain
                 table_data = [header] + domain_rows
 
-                schema = TableSchema(
-                    headers=header,
-                    column_count=len(header),
-                    has_header=True,
-                    header_row_indices=[0],
-                )
-
                 table = ExtractedTable(
                     data=table_data,
                     schema=schema,
@@ -181,6 +176,44 @@ class TableSegmenter:
 
         return segmented_tables
 
+    @staticmethod
+    def _bucket_by_domain(
+        scored_rows: List[Tuple[float, List[str]]], score_domains: List[ScoreDomain]
+    ) -> List[List[List[str]]]:
+        """
+        Assign rows to the score domains containing their score.
+
+        Args:
+            scored_rows: (score, row) pairs in document order
+            score_domains: Score domain definitions
+
+        Returns:
+            Rows for each domain, in the order of score_domains
+        """
+        order = sorted(range(len(score_domains)), key=lambda i: score_domains[i].min_score)
+        bounds = [(score_domains[i].min_score, score_domains[i].max_score) for i in order]
+        disjoint = all(lo <= hi for lo, hi in bounds) and all(
+            prev[1] < cur[0] for prev, cur in zip(bounds, bounds[1:])
+        )
+
+        if not disjoint:
+            # Overlapping domains can share rows; filter each domain separately
+            return [
+                [row for score_num, row in scored_rows if domain.min_score <= score_num <= domain.max_score]
+                for domain in score_domains
+            ]
+
+        # Disjoint domains: one bisect over the sorted upper bounds per row
+        upper_bounds = [hi for _, hi in bounds]
+        buckets: List[List[List[str]]] = [[] for _ in score_domains]
+        domain_count = len(order)
+        for score_num, row in scored_rows:
+            pos = bisect_left(upper_bounds, score_num)
+            if pos < domain_count and bounds[pos][0] <= score_num:
+                buckets[order[pos]].append(row)
+
+        return buckets
+
     def segment_by_header_repetition(
         self,
         all_tables: List[Dict[str, Any]],
@@ -203,16 +236,8 @@ class TableSegmenter:
             return []
 
         # Merge all data across pages
-        merged_data = []
-        source_pages = []
-
-        for table_dict in all_tables:
-            data = table_dict.get("data", [])
-            page = table_dict.get("page", 1)
-
-            merged_data.extend(data)
-            if page not in source_pages:
-                source_pages.append(page)
+        merged_data = list(chain.from_iterable(t.get("data", ()) for t in all_tables))
+        source_pages = sorted({t.get("page", 1) for t in all_tables})
 
         if not merged_data:
             return []
@@ -229,13 +254,19 @@ class TableSegmenter:
         current_section = []
         current_header = None
         section_title = None
+        # Candidate rows are compared as lists, so no tuple is built per row
+        header_cells = list(header_pattern)
+        pattern_len = len(header_cells)
 
         for row in merged_data:
             if not row:
                 continue
 
-            # Check if this row is a header
-            if self._is_header_row(row, header_pattern):
+            # Strip cells once for both the header and section-title checks
+            stripped = [cell.strip() for cell in row]
+
+            # Check if this row matches the header pattern
+            if len(stripped) == pattern_len and [cell.upper() for cell in stripped] == header_cells:
                 # Save previous section if exists
                 if current_section and current_header:
                     table = self._create_table_from_section(
@@ -249,9 +280,9 @@ class TableSegmenter:
                 current_section = []
                 section_title = None
 
-            # Check if this row is a section title
-            elif self._is_section_title(row):
-                section_title = row[0] if row else None
+            # Check if this row is a section title (text in first cell only)
+            elif len(stripped) >= 2 and stripped[0] and not any(stripped[1:]):
+                section_title = row[0]
 
             # Regular data row
             else:
@@ -285,21 +316,22 @@ class TableSegmenter:
             List of detected score domains
         """
         # Extract all score values from first column
-        scores = []
+        extract_number = self._extract_number
+        scores = set()
 
         for table_dict in all_tables:
             data = table_dict.get("data", [])
             for row in data[1:]:  # Skip header
                 if row:
-                    score_num = self._extract_number(row[0])
+                    score_num = extract_number(row[0])
                     if score_num is not None:
-                        scores.append(score_num)
+                        scores.add(score_num)
 
         if not scores:
             return []
 
         # Find natural breaks in score distribution
-        scores = sorted(set(scores))
+        scores = sorted(scores)
 
         # Simple heuristic: split at gaps > 5
         domains = []
@@ -340,15 +372,15 @@ class TableSegmenter:
         Returns:
             Header pattern tuple, or None if no pattern found
         """
-        header_counts: Dict[Tuple[str, ...], int] = {}
+        header_counts: Counter[Tuple[str, ...]] = Counter()
+        intern = sys.intern
 
         for table_dict in all_tables:
             data = table_dict.get("data", [])
             for row in data:
-                if row and all(cell.strip() for cell in row):
-                    # This could be a header
-                    row_tuple = tuple(cell.strip().upper() for cell in row)
-                    header_counts[row_tuple] = header_counts.get(row_tuple, 0) + 1
+                if row and all(map(str.strip, row)):
+                    # This could be a header; interned cells let repeats share strings
+                    header_counts[tuple([intern(cell.strip().upper()) for cell in row])] += 1
 
         # Find most repeated pattern (appears 2+ times)
         for pattern, count in header_counts.items():
@@ -357,30 +389,6 @@ class TableSegmenter:
 
         return None
 
-    def _is_header_row(
-        self, row: List[str], header_pattern: Tuple[str, ...]
-    ) -> bool:
-        """Check if row matches header pattern."""
-        if not row or len(row) != len(header_pattern):
-            return False
-
-        row_tuple = tuple(cell.strip().upper() for cell in row)
-        return row_tuple == header_pattern
-
-    def _is_section_title(self, row: List[str]) -> bool:
-        """
-        Check if row is a section title.
-
-        Section titles typically have text in first cell only.
-        """
-        if not row or len(row) < 2:
-            return False
-
-        first_cell = row[0].strip()
-        other_cells = [cell.strip() for cell in row[1:]]
-
-        return bool(first_cell) and all(not cell for cell in other_cells)
-
     def _create_table_from_section(
         self,
         header: List[str],
@@ -440,11 +448,7 @@ class TableSegmenter:
     @staticmethod
     def _is_numeric(value: str) -> bool:
         """Check if value is numeric."""
-        try:
-            float(str(value).replace(",", "").strip())
-            return True
-        except (ValueError, AttributeError):
-            return False
+        return _NUM_RE.fullmatch(str(value).replace(",", "").strip()) is not None
 
     @staticmethod
     def _extract_number(value: Any) -> Optional[float]:
@@ -452,9 +456,8 @@ class TableSegmenter:
         if value is None:
             return None
 
-        try:
-            # Remove commas and whitespace
-            cleaned = str(value).replace(",", "").strip()
-            return float(cleaned)
-        except (ValueError, AttributeError):
+        # Remove commas and whitespace
+        cleaned = str(value).replace(",", "").strip()
+        if _NUM_RE.fullmatch(cleaned) is None:
             return None
+        return float(cleaned)
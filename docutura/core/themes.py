@@ -4,8 +4,9 @@ Theme system for DocTura Desktop.
 Provides Corporate and Indigenous themes with defined color palettes.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Dict
 
 
@@ -40,46 +41,48 @@ class ThemeType(str, Enum):
     INDIGENOUS = "indigenous"
 
 
+@dataclass(frozen=True, slots=True)
 class Theme:
     """Theme definition with colors and usage rules."""
 
-    def __init__(
-        self,
-        name: str,
-        description: str,
-        palette: ColorPalette,
-        button_primary_color: str,
-        button_accent_color: str,
-        header_color: str,
-        table_background: str,
-    ):
-        self.name = name
-        self.description = description
-        self.palette = palette
-        self.button_primary_color = button_primary_color
-        self.button_accent_color = button_accent_color
-        self.header_color = header_color
-        self.table_background = table_background
+    name: str
+    description: str
+    palette: ColorPalette
+    button_primary_color: str
+    button_accent_color: str
+    header_color: str
+    table_background: str
+
+    # Qt stylesheet variables, built once (themes are immutable)
+    _variables: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        palette = self.palette
+        object.__setattr__(
+            self,
+            "_variables",
+            {
+                "primary": palette.primary,
+                "secondary": palette.secondary,
+                "accent": palette.accent,
+                "highlight": palette.highlight or palette.accent,
+                "background": palette.background,
+                "surface": palette.surface,
+                "text_primary": palette.text_primary,
+                "text_secondary": palette.text_secondary,
+                "success": palette.success,
+                "warning": palette.warning,
+                "error": palette.error,
+                "button_primary": self.button_primary_color,
+                "button_accent": self.button_accent_color,
+                "header": self.header_color,
+                "table_bg": self.table_background,
+            },
+        )
 
     def get_stylesheet_variables(self) -> Dict[str, str]:
-        """Get theme variables for Qt stylesheet."""
-        return {
-            "primary": self.palette.primary,
-            "secondary": self.palette.secondary,
-            "accent": self.palette.accent,
-            "highlight": self.palette.highlight or self.palette.accent,
-            "background": self.palette.background,
-            "surface": self.palette.surface,
-            "text_primary": self.palette.text_primary,
-            "text_secondary": self.palette.text_secondary,
-            "success": self.palette.success,
-            "warning": self.palette.warning,
-            "error": self.palette.error,
-            "button_primary": self.button_primary_color,
-            "button_accent": self.button_accent_color,
-            "header": self.header_color,
-            "table_bg": self.table_background,
-        }
+        """Get theme variables for Qt stylesheet (shared; do not mutate)."""
+        return self._variables
 
 
 # Corporate Theme Definition
@@ -145,234 +148,242 @@ def get_theme(theme_type: ThemeType) -> Theme:
     return THEMES[theme_type]
 
 
-def get_qt_stylesheet(theme: Theme) -> str:
-    """
-    Generate Qt stylesheet from theme.
-
-    Args:
-        theme: Theme to apply
-
-    Returns:
-        Qt stylesheet string
-    """
-    vars = theme.get_stylesheet_variables()
+# Qt stylesheet template; %(key)s placeholders are get_stylesheet_variables() keys plus name
+_QSS_TEMPLATE = """
+    /* DocTura Desktop - %(name)s Theme */
 
-    stylesheet = f"""
-    /* DocTura Desktop - {theme.name} Theme */
+    QMainWindow {
+        background-color: %(background)s;
+    }
 
-    QMainWindow {{
-        background-color: {vars['background']};
-    }}
-
-    QWidget {{
-        background-color: {vars['background']};
-        color: {vars['text_primary']};
+    QWidget {
+        background-color: %(background)s;
+        color: %(text_primary)s;
         font-family: "Segoe UI", Arial, sans-serif;
         font-size: 10pt;
-    }}
+    }
 
     /* Headers */
-    QLabel[heading="true"] {{
-        color: {vars['header']};
+    QLabel[heading="true"] {
+        color: %(header)s;
         font-size: 14pt;
         font-weight: bold;
         padding: 10px 0px;
-    }}
+    }
 
-    QLabel[subheading="true"] {{
-        color: {vars['text_primary']};
+    QLabel[subheading="true"] {
+        color: %(text_primary)s;
         font-size: 11pt;
         font-weight: 600;
         padding: 5px 0px;
-    }}
+    }
 
     /* Primary Buttons */
-    QPushButton {{
-        background-color: {vars['button_primary']};
+    QPushButton {
+        background-color: %(button_primary)s;
         color: white;
         border: none;
         border-radius: 4px;
         padding: 10px 20px;
         font-weight: 600;
         min-width: 100px;
-    }}
+    }
 
-    QPushButton:hover {{
-        background-color: {vars['secondary']};
-    }}
+    QPushButton:hover {
+        background-color: %(secondary)s;
+    }
 
-    QPushButton:pressed {{
-        background-color: {vars['text_secondary']};
-    }}
+    QPushButton:pressed {
+        background-color: %(text_secondary)s;
+    }
 
-    QPushButton:disabled {{
-        background-color: {vars['text_secondary']};
+    QPushButton:disabled {
+        background-color: %(text_secondary)s;
         color: #CCCCCC;
-    }}
+    }
 
     /* Accent Buttons */
-    QPushButton[accent="true"] {{
-        background-color: {vars['button_accent']};
+    QPushButton[accent="true"] {
+        background-color: %(button_accent)s;
         color: white;
-    }}
+    }
 
-    QPushButton[accent="true"]:hover {{
-        background-color: {vars['highlight']};
-    }}
+    QPushButton[accent="true"]:hover {
+        background-color: %(highlight)s;
+    }
 
     /* Secondary Buttons */
-    QPushButton[secondary="true"] {{
-        background-color: {vars['surface']};
-        color: {vars['primary']};
-        border: 2px solid {vars['primary']};
-    }}
-
-    QPushButton[secondary="true"]:hover {{
-        background-color: {vars['primary']};
+    QPushButton[secondary="true"] {
+        background-color: %(surface)s;
+        color: %(primary)s;
+        border: 2px solid %(primary)s;
+    }
+
+    QPushButton[secondary="true"]:hover {
+        background-color: %(primary)s;
         color: white;
-    }}
+    }
 
     /* Input Fields */
-    QLineEdit, QTextEdit, QPlainTextEdit, QComboBox {{
-        background-color: {vars['surface']};
-        border: 1px solid {vars['text_secondary']};
+    QLineEdit, QTextEdit, QPlainTextEdit, QComboBox {
+        background-color: %(surface)s;
+        border: 1px solid %(text_secondary)s;
         border-radius: 4px;
         padding: 8px;
-        color: {vars['text_primary']};
-    }}
+        color: %(text_primary)s;
+    }
 
-    QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QComboBox:focus {{
-        border: 2px solid {vars['primary']};
-    }}
+    QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QComboBox:focus {
+        border: 2px solid %(primary)s;
+    }
 
     /* Group Boxes */
-    QGroupBox {{
-        background-color: {vars['surface']};
-        border: 1px solid {vars['text_secondary']};
+    QGroupBox {
+        background-color: %(surface)s;
+        border: 1px solid %(text_secondary)s;
         border-radius: 6px;
         margin-top: 10px;
         padding: 15px;
         font-weight: 600;
-    }}
+    }
 
-    QGroupBox::title {{
-        color: {vars['header']};
+    QGroupBox::title {
+        color: %(header)s;
         subcontrol-origin: margin;
         left: 10px;
         padding: 0 5px;
-    }}
+    }
 
     /* Tables */
-    QTableWidget, QTableView {{
-        background-color: {vars['table_bg']};
-        alternate-background-color: {vars['surface']};
-        gridline-color: {vars['text_secondary']};
-        border: 1px solid {vars['text_secondary']};
+    QTableWidget, QTableView {
+        background-color: %(table_bg)s;
+        alternate-background-color: %(surface)s;
+        gridline-color: %(text_secondary)s;
+        border: 1px solid %(text_secondary)s;
         border-radius: 4px;
-    }}
+    }
 
-    QTableWidget::item, QTableView::item {{
+    QTableWidget::item, QTableView::item {
         padding: 5px;
-    }}
+    }
 
-    QHeaderView::section {{
-        background-color: {vars['primary']};
+    QHeaderView::section {
+        background-color: %(primary)s;
         color: white;
         padding: 8px;
         border: none;
         font-weight: 600;
-    }}
+    }
 
     /* Progress Bar */
-    QProgressBar {{
-        border: 1px solid {vars['text_secondary']};
+    QProgressBar {
+        border: 1px solid %(text_secondary)s;
         border-radius: 4px;
         text-align: center;
-        background-color: {vars['surface']};
-        color: {vars['text_primary']};
-    }}
+        background-color: %(surface)s;
+        color: %(text_primary)s;
+    }
 
-    QProgressBar::chunk {{
-        background-color: {vars['success']};
+    QProgressBar::chunk {
+        background-color: %(success)s;
         border-radius: 3px;
-    }}
+    }
 
     /* Status Messages */
-    QLabel[status="success"] {{
-        color: {vars['success']};
+    QLabel[status="success"] {
+        color: %(success)s;
         font-weight: 600;
-    }}
+    }
 
-    QLabel[status="warning"] {{
-        color: {vars['warning']};
+    QLabel[status="warning"] {
+        color: %(warning)s;
         font-weight: 600;
-    }}
+    }
 
-    QLabel[status="error"] {{
-        color: {vars['error']};
+    QLabel[status="error"] {
+        color: %(error)s;
         font-weight: 600;
-    }}
+    }
 
     /* Checkboxes and Radio Buttons */
-    QCheckBox, QRadioButton {{
-        color: {vars['text_primary']};
+    QCheckBox, QRadioButton {
+        color: %(text_primary)s;
         spacing: 8px;
-    }}
+    }
 
-    QCheckBox::indicator, QRadioButton::indicator {{
+    QCheckBox::indicator, QRadioButton::indicator {
         width: 18px;
         height: 18px;
-        border: 2px solid {vars['primary']};
+        border: 2px solid %(primary)s;
         border-radius: 3px;
-        background-color: {vars['surface']};
-    }}
+        background-color: %(surface)s;
+    }
 
-    QCheckBox::indicator:checked, QRadioButton::indicator:checked {{
-        background-color: {vars['primary']};
-    }}
+    QCheckBox::indicator:checked, QRadioButton::indicator:checked {
+        background-color: %(primary)s;
+    }
 
     /* Scroll Bars */
-    QScrollBar:vertical {{
-        background-color: {vars['background']};
+    QScrollBar:vertical {
+        background-color: %(background)s;
         width: 12px;
         border-radius: 6px;
-    }}
+    }
 
-    QScrollBar::handle:vertical {{
-        background-color: {vars['text_secondary']};
+    QScrollBar::handle:vertical {
+        background-color: %(text_secondary)s;
         border-radius: 6px;
         min-height: 20px;
-    }}
+    }
 
-    QScrollBar::handle:vertical:hover {{
-        background-color: {vars['primary']};
-    }}
+    QScrollBar::handle:vertical:hover {
+        background-color: %(primary)s;
+    }
 
     /* Tab Widget */
-    QTabWidget::pane {{
-        border: 1px solid {vars['text_secondary']};
+    QTabWidget::pane {
+        border: 1px solid %(text_secondary)s;
         border-radius: 4px;
-        background-color: {vars['surface']};
-    }}
+        background-color: %(surface)s;
+    }
 
-    QTabBar::tab {{
-        background-color: {vars['background']};
-        color: {vars['text_primary']};
+    QTabBar::tab {
+        background-color: %(background)s;
+        color: %(text_primary)s;
         padding: 10px 20px;
-        border: 1px solid {vars['text_secondary']};
+        border: 1px solid %(text_secondary)s;
         border-bottom: none;
         border-top-left-radius: 4px;
         border-top-right-radius: 4px;
-    }}
+    }
 
-    QTabBar::tab:selected {{
-        background-color: {vars['primary']};
+    QTabBar::tab:selected {
+        background-color: %(primary)s;
         color: white;
-    }}
+    }
 
-    QTabBar::tab:hover:!selected {{
-        background-color: {vars['highlight']};
-    }}
+    QTabBar::tab:hover:!selected {
+        background-color: %(highlight)s;
+    }
     """
 
-    return stylesheet
+
+@lru_cache(maxsize=8)
+def get_qt_stylesheet(theme: Theme) -> str:
+    """
+    Generate Qt stylesheet from theme (cached; themes are immutable).
+
+    Args:
+        theme: Theme to apply
+
+    Returns:
+        Qt stylesheet string
+    """
+    return _QSS_TEMPLATE % {**theme.get_stylesheet_variables(), "name": theme.name}
+
+
+# Stylesheets for the built-in themes, generated once at import (this also
+# primes get_qt_stylesheet's cache, so applying a built-in theme never formats)
+PRECOMPUTED_STYLESHEETS: Dict[ThemeType, str] = {
+    theme_type: get_qt_stylesheet(theme) for theme_type, theme in THEMES.items()
+}
@@ -4,7 +4,8 @@ Deterministic validation system for DocTura Desktop.
 Validates extracted tables using generic and domain-specific rules.
 """
 
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
 
 from docutura.core.models import (
     ExtractedTable,
@@ -13,6 +14,32 @@ from docutura.core.models import (
     ValidationStatus,
 )
 
+# Header keywords identifying distribution-table columns (matched as substrings)
+_PERCENT_COLUMN_RE = re.compile(r"percent|percentage|%")
+_CUMULATIVE_COLUMN_RE = re.compile(r"cumulative|cum|cum\.")
+_FREQUENCY_COLUMN_RE = re.compile(r"frequency|freq|f")
+_SCORE_COLUMN_RE = re.compile(r"score|mark|grade")
+
+# Header substrings marking a table as a distribution (2+ needed) or a roster (any);
+# the distribution words never overlap, so findall sees every one present
+_DISTRIBUTION_INDICATOR_RE = re.compile(r"frequency|percent|cumulative|score|mark")
+_ROSTER_INDICATOR_RE = re.compile(r"name|position|department|staff|student|employee")
+
+# Rows reported individually for column-count mismatches before summarizing
+_MAX_COLUMN_COUNT_ISSUES = 5
+
+# Fixed issue messages (messages with values are formatted only when raised)
+_MSG_DUPLICATE_ROW = "Duplicate row found"
+_MSG_NO_HEADER = "Table has no detected header"
+_MSG_ORPHAN_ROW = "Possible orphan row detected"
+
+# Severity order used to keep the worst status seen
+_STATUS_PRIORITY = {
+    ValidationStatus.PASSED: 0,
+    ValidationStatus.WARNING: 1,
+    ValidationStatus.FAILED: 2,
+}
+
 
 class TableValidator:
     """Validates extracted tables using deterministic rules."""
@@ -89,12 +116,18 @@ class TableValidator:
         status = self._validate_header_before_data(table, table_name, report)
         worst_status = self._update_worst_status(worst_status, status)
 
-        # Detect table type for specific validations
-        if self._is_distribution_table(table):
-            status = self._validate_distribution_table(table, table_name, report)
+        # Empty tables get no type-specific validation
+        if table.is_empty:
+            return worst_status
+
+        # Detect table type for specific validations (headers lowercased once)
+        headers_lower = [h.lower() for h in table.schema.headers]
+
+        if self._is_distribution_table(headers_lower):
+            status = self._validate_distribution_table(table, table_name, report, headers_lower)
             worst_status = self._update_worst_status(worst_status, status)
 
-        if self._is_roster_table(table):
+        if self._is_roster_table(headers_lower):
             status = self._validate_roster_table(table, table_name, report)
             worst_status = self._update_worst_status(worst_status, status)
 
@@ -104,22 +137,27 @@ class TableValidator:
         self, table: ExtractedTable, table_name: str, report: ValidationReport
     ) -> ValidationStatus:
         """Validate no duplicate rows (except header)."""
-        if table.is_empty or len(table.data) <= 1:
+        data = table.data
+        if len(data) <= 1:
             return ValidationStatus.PASSED
 
         seen_rows = set()
-        data_rows = table.data[1:] if table.schema.has_header else table.data
+        has_header = table.schema.has_header
+        data_rows = data[1:] if has_header else data
+
+        for idx, row in enumerate(data_rows, start=1 if has_header else 0):
+            row_tuple = tuple(map(str.strip, map(str, row)))
 
-        for idx, row in enumerate(data_rows):
-            row_tuple = tuple(str(cell).strip() for cell in row)
+            if not any(row_tuple):  # Ignore empty rows
+                continue
 
-            if row_tuple in seen_rows and any(row_tuple):  # Ignore empty rows
+            if row_tuple in seen_rows:
                 report.add_issue(
                     ValidationIssue(
                         severity=ValidationStatus.FAILED,
-                        message=f"Duplicate row found",
+                        message=_MSG_DUPLICATE_ROW,
                         table_name=table_name,
-                        row_index=idx + (1 if table.schema.has_header else 0),
+                        row_index=idx,
                         details={"row_content": list(row_tuple)},
                     )
                 )
@@ -137,11 +175,16 @@ class TableValidator:
             return ValidationStatus.PASSED
 
         expected_cols = table.schema.column_count
-        status = ValidationStatus.PASSED
+        issues: List[ValidationIssue] = []
+        mismatches = 0
 
         for idx, row in enumerate(table.data):
             if len(row) != expected_cols:
-                report.add_issue(
+                mismatches += 1
+                if mismatches > _MAX_COLUMN_COUNT_ISSUES:
+                    continue
+
+                issues.append(
                     ValidationIssue(
                         severity=ValidationStatus.WARNING,
                         message=f"Inconsistent column count: expected {expected_cols}, got {len(row)}",
@@ -150,19 +193,35 @@ class TableValidator:
                         details={"expected": expected_cols, "actual": len(row)},
                     )
                 )
-                status = ValidationStatus.WARNING
 
-        return status
+        if not mismatches:
+            return ValidationStatus.PASSED
+
+        # Summarize the rest instead of reporting every row of a badly extracted table
+        remaining = mismatches - _MAX_COLUMN_COUNT_ISSUES
+        if remaining > 0:
+            issues.append(
+                ValidationIssue(
+                    severity=ValidationStatus.WARNING,
+                    message=f"... and {remaining} more rows with inconsistent column count",
+                    table_name=table_name,
+                    details={"expected": expected_cols, "additional_rows": remaining},
+                )
+            )
+
+        report.add_issues(issues)
+
+        return ValidationStatus.WARNING
 
     def _validate_header_before_data(
         self, table: ExtractedTable, table_name: str, report: ValidationReport
     ) -> ValidationStatus:
         """Validate header comes before data (for rosters)."""
-        if not table.schema.has_header and len(table.data) > 0:
+        if not table.schema.has_header and table.data:
             report.add_issue(
                 ValidationIssue(
                     severity=ValidationStatus.WARNING,
-                    message="Table has no detected header",
+                    message=_MSG_NO_HEADER,
                     table_name=table_name,
                     details={"rows": len(table.data)},
                 )
@@ -172,7 +231,11 @@ class TableValidator:
         return ValidationStatus.PASSED
 
     def _validate_distribution_table(
-        self, table: ExtractedTable, table_name: str, report: ValidationReport
+        self,
+        table: ExtractedTable,
+        table_name: str,
+        report: ValidationReport,
+        headers_lower: List[str],
     ) -> ValidationStatus:
         """
         Validate statistical distribution table.
@@ -184,33 +247,42 @@ class TableValidator:
         - Score ranges match domain
         """
         status = ValidationStatus.PASSED
+        issues: List[ValidationIssue] = []
+        headers = table.schema.headers
 
         # Find percent and cumulative columns
-        percent_col_idx = self._find_column_index(
-            table.schema.headers, ["percent", "percentage", "%"]
-        )
-        cumulative_col_idx = self._find_column_index(
-            table.schema.headers, ["cumulative", "cum", "cum."]
-        )
-        frequency_col_idx = self._find_column_index(
-            table.schema.headers, ["frequency", "freq", "f"]
-        )
-        score_col_idx = self._find_column_index(
-            table.schema.headers, ["score", "mark", "grade"]
+        percent_col_idx = self._find_column_index(headers_lower, _PERCENT_COLUMN_RE)
+        cumulative_col_idx = self._find_column_index(headers_lower, _CUMULATIVE_COLUMN_RE)
+        frequency_col_idx = self._find_column_index(headers_lower, _FREQUENCY_COLUMN_RE)
+        score_col_idx = self._find_column_index(headers_lower, _SCORE_COLUMN_RE)
+
+        # Scores are only checked against an explicit domain
+        if not table.score_domain:
+            score_col_idx = None
+
+        # Parse every checked column in a single pass over the rows
+        columns = self._numeric_columns(
+            table,
+            [
+                col_idx
+                for col_idx in (percent_col_idx, frequency_col_idx, cumulative_col_idx, score_col_idx)
+                if col_idx is not None
+            ],
         )
 
         # Validate percent total = 100
         if percent_col_idx is not None:
-            percent_total = self._sum_column(table, percent_col_idx)
+            percent_values = columns[percent_col_idx]
+            percent_total = sum(val for _, val in percent_values) if percent_values else None
 
             if percent_total is not None:
                 if abs(percent_total - 100.0) > self.tolerance * 100:
-                    report.add_issue(
+                    issues.append(
                         ValidationIssue(
                             severity=ValidationStatus.FAILED,
                             message=f"Percent column does not sum to 100.00 (got {percent_total:.2f})",
                             table_name=table_name,
-                            column_name=table.schema.headers[percent_col_idx],
+                            column_name=headers[percent_col_idx],
                             details={
                                 "expected": 100.0,
                                 "actual": percent_total,
@@ -222,68 +294,55 @@ class TableValidator:
 
         # Validate non-negative frequencies
         if frequency_col_idx is not None:
-            for idx, row in enumerate(table.data[1:], start=1):
-                if len(row) > frequency_col_idx:
-                    freq_val = self._extract_number(row[frequency_col_idx])
-                    if freq_val is not None and freq_val < 0:
-                        report.add_issue(
-                            ValidationIssue(
-                                severity=ValidationStatus.FAILED,
-                                message=f"Negative frequency found: {freq_val}",
-                                table_name=table_name,
-                                row_index=idx,
-                                column_name=table.schema.headers[frequency_col_idx],
-                            )
+            for idx, freq_val in columns[frequency_col_idx]:
+                if freq_val < 0:
+                    issues.append(
+                        ValidationIssue(
+                            severity=ValidationStatus.FAILED,
+                            message=f"Negative frequency found: {freq_val}",
+                            table_name=table_name,
+                            row_index=idx,
+                            column_name=headers[frequency_col_idx],
                         )
-                        status = ValidationStatus.FAILED
+                    )
+                    status = ValidationStatus.FAILED
 
         # Validate monotonic cumulative frequency
         if cumulative_col_idx is not None:
-            prev_cumulative = None
-
-            for idx, row in enumerate(table.data[1:], start=1):
-                if len(row) > cumulative_col_idx:
-                    cum_val = self._extract_number(row[cumulative_col_idx])
-
-                    if cum_val is not None:
-                        if prev_cumulative is not None and cum_val < prev_cumulative:
-                            report.add_issue(
-                                ValidationIssue(
-                                    severity=ValidationStatus.FAILED,
-                                    message=f"Cumulative frequency not monotonic: {cum_val} < {prev_cumulative}",
-                                    table_name=table_name,
-                                    row_index=idx,
-                                    column_name=table.schema.headers[cumulative_col_idx],
-                                )
-                            )
-                            status = ValidationStatus.FAILED
-
-                        prev_cumulative = cum_val
+            cumulative_values = columns[cumulative_col_idx]
+
+            for (_, prev_cumulative), (idx, cum_val) in zip(cumulative_values, cumulative_values[1:]):
+                if cum_val < prev_cumulative:
+                    issues.append(
+                        ValidationIssue(
+                            severity=ValidationStatus.FAILED,
+                            message=f"Cumulative frequency not monotonic: {cum_val} < {prev_cumulative}",
+                            table_name=table_name,
+                            row_index=idx,
+                            column_name=headers[cumulative_col_idx],
+                        )
+                    )
+                    status = ValidationStatus.FAILED
 
         # Validate score domain if specified
-        if table.score_domain and score_col_idx is not None:
-            for idx, row in enumerate(table.data[1:], start=1):
-                if len(row) > score_col_idx:
-                    score_val = self._extract_number(row[score_col_idx])
-
-                    if score_val is not None:
-                        if not (
-                            table.score_domain.min_score
-                            <= score_val
-                            <= table.score_domain.max_score
-                        ):
-                            report.add_issue(
-                                ValidationIssue(
-                                    severity=ValidationStatus.WARNING,
-                                    message=f"Score {score_val} outside domain range [{table.score_domain.min_score}, {table.score_domain.max_score}]",
-                                    table_name=table_name,
-                                    row_index=idx,
-                                    column_name=table.schema.headers[score_col_idx],
-                                )
-                            )
-                            status = self._update_worst_status(
-                                status, ValidationStatus.WARNING
-                            )
+        if score_col_idx is not None:
+            min_score = table.score_domain.min_score
+            max_score = table.score_domain.max_score
+
+            for idx, score_val in columns[score_col_idx]:
+                if not (min_score <= score_val <= max_score):
+                    issues.append(
+                        ValidationIssue(
+                            severity=ValidationStatus.WARNING,
+                            message=f"Score {score_val} outside domain range [{min_score}, {max_score}]",
+                            table_name=table_name,
+                            row_index=idx,
+                            column_name=headers[score_col_idx],
+                        )
+                    )
+                    status = self._update_worst_status(status, ValidationStatus.WARNING)
+
+        report.add_issues(issues)
 
         return status
 
@@ -299,87 +358,84 @@ class TableValidator:
         - Header detected
         """
         status = ValidationStatus.PASSED
+        issues: List[ValidationIssue] = []
 
         # Already checked header and column consistency in generic validations
 
         # Check for orphan rows (single-cell rows that aren't section titles)
-        for idx, row in enumerate(table.data):
-            non_empty_cells = [cell for cell in row if str(cell).strip()]
-
-            if len(non_empty_cells) == 1 and idx > 0:
-                # Could be section title or orphan
-                # Section titles are OK, but isolated cells are suspicious
-                if idx < len(table.data) - 1:
-                    next_row = table.data[idx + 1]
-                    next_non_empty = [cell for cell in next_row if str(cell).strip()]
-
-                    if len(next_non_empty) == 1:
-                        # Two single-cell rows in a row = likely orphan
-                        report.add_issue(
-                            ValidationIssue(
-                                severity=ValidationStatus.WARNING,
-                                message="Possible orphan row detected",
-                                table_name=table_name,
-                                row_index=idx,
-                                details={"content": row[0]},
-                            )
-                        )
-                        status = ValidationStatus.WARNING
+        data = table.data
+        non_empty_counts = [sum(1 for cell in row if str(cell).strip()) for row in data]
+
+        for idx in range(1, len(data) - 1):
+            # Could be section title or orphan
+            # Section titles are OK, but isolated cells are suspicious
+            if non_empty_counts[idx] == 1 and non_empty_counts[idx + 1] == 1:
+                # Two single-cell rows in a row = likely orphan
+                issues.append(
+                    ValidationIssue(
+                        severity=ValidationStatus.WARNING,
+                        message=_MSG_ORPHAN_ROW,
+                        table_name=table_name,
+                        row_index=idx,
+                        details={"content": data[idx][0]},
+                    )
+                )
+                status = ValidationStatus.WARNING
+
+        report.add_issues(issues)
 
         return status
 
     @staticmethod
-    def _is_distribution_table(table: ExtractedTable) -> bool:
-        """Detect if table is a statistical distribution table."""
-        if table.is_empty:
-            return False
-
-        headers_lower = [h.lower() for h in table.schema.headers]
-
-        # Look for distribution table indicators
-        indicators = ["frequency", "percent", "cumulative", "score", "mark"]
-        matches = sum(1 for indicator in indicators if any(indicator in h for h in headers_lower))
+    def _is_distribution_table(headers_lower: List[str]) -> bool:
+        """Detect if a (non-empty) table is a statistical distribution table."""
+        # Look for distribution table indicators (distinct ones found in any header)
+        matches = set(_DISTRIBUTION_INDICATOR_RE.findall("\n".join(headers_lower)))
 
-        return matches >= 2
+        return len(matches) >= 2
 
     @staticmethod
-    def _is_roster_table(table: ExtractedTable) -> bool:
-        """Detect if table is a roster/list table."""
-        if table.is_empty:
-            return False
-
-        headers_lower = [h.lower() for h in table.schema.headers]
-
+    def _is_roster_table(headers_lower: List[str]) -> bool:
+        """Detect if a (non-empty) table is a roster/list table."""
         # Look for roster indicators
-        indicators = ["name", "position", "department", "staff", "student", "employee"]
-        return any(indicator in " ".join(headers_lower) for indicator in indicators)
+        return _ROSTER_INDICATOR_RE.search(" ".join(headers_lower)) is not None
 
     @staticmethod
-    def _find_column_index(headers: List[str], keywords: List[str]) -> Optional[int]:
-        """Find column index by keyword match."""
-        headers_lower = [h.lower() for h in headers]
+    def _find_column_index(headers_lower: List[str], keywords: Pattern[str]) -> Optional[int]:
+        """Find the first column whose lowercased header contains a keyword."""
+        search = keywords.search
+        return next((idx for idx, header in enumerate(headers_lower) if search(header)), None)
 
-        for idx, header in enumerate(headers_lower):
-            for keyword in keywords:
-                if keyword in header:
-                    return idx
+    @staticmethod
+    def _numeric_columns(
+        table: ExtractedTable, col_indices: List[int]
+    ) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        Parse the numeric cells of several columns in one pass over the rows.
 
-        return None
+        Args:
+            table: Table to read (header row skipped)
+            col_indices: Column indices to parse
 
-    @staticmethod
-    def _sum_column(table: ExtractedTable, col_idx: int) -> Optional[float]:
-        """Sum numeric values in a column."""
-        total = 0.0
-        count = 0
+        Returns:
+            Per column index, (row index, value) pairs for cells holding a number
+        """
+        extract_number = TableValidator._extract_number
+        columns: Dict[int, List[Tuple[int, float]]] = {col_idx: [] for col_idx in col_indices}
+        targets = list(columns.items())
+
+        if not targets:
+            return columns
 
-        for row in table.data[1:]:  # Skip header
-            if len(row) > col_idx:
-                val = TableValidator._extract_number(row[col_idx])
-                if val is not None:
-                    total += val
-                    count += 1
+        for idx, row in enumerate(table.data[1:], start=1):
+            row_len = len(row)
+            for col_idx, values in targets:
+                if row_len > col_idx:
+                    val = extract_number(row[col_idx])
+                    if val is not None:
+                        values.append((idx, val))
 
-        return total if count > 0 else None
+        return columns
 
     @staticmethod
     def _extract_number(value: any) -> Optional[float]:
@@ -387,10 +443,18 @@ class TableValidator:
         if value is None:
             return None
 
+        # Numeric cells need no text cleanup (bool is excluded: "True" never parsed)
+        cls = value.__class__
+        if cls is float or cls is int:
+            return float(value)
+
+        cleaned = value if cls is str else str(value)
+        if "," in cleaned or "%" in cleaned:
+            cleaned = cleaned.replace(",", "").replace("%", "")
+
         try:
-            cleaned = str(value).replace(",", "").replace("%", "").strip()
-            return float(cleaned)
-        except (ValueError, AttributeError):
+            return float(cleaned.strip())
+        except ValueError:
             return None
 
     @staticmethod
@@ -398,12 +462,4 @@ class TableValidator:
         current: ValidationStatus, new: ValidationStatus
     ) -> ValidationStatus:
         """Update to worst status."""
-        priority = {
-            ValidationStatus.PASSED: 0,
-            ValidationStatus.WARNING: 1,
-            ValidationStatus.FAILED: 2,
-        }
-
-        if priority[new] > priority[current]:
-            return new
-        return current
+        return new if _STATUS_PRIORITY[new] > _STATUS_PRIORITY[current] else current
@@ -4,23 +4,62 @@ Word output engine for DocTura Desktop.
 Supports orientation control and table formatting.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from docx import Document
 from docx.enum.section import WD_ORIENTATION, WD_SECTION_START
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
-from docx.shared import Inches, Pt, RGBColor
-from docx.table import Table as DocxTable
+from docx.oxml.table import CT_Tbl
+from docx.shared import Inches, RGBColor
+from lxml.etree import SubElement
 
 from docutura.core.models import DocumentMetadata, ExtractedTable, WordOrientation
 from docutura.core.themes import Theme
 
+# WordprocessingML names used when building table rows directly
+_W_TR = qn("w:tr")
+_W_TC = qn("w:tc")
+_W_TCPR = qn("w:tcPr")
+_W_TCW = qn("w:tcW")
+_W_SHD = qn("w:shd")
+_W_P = qn("w:p")
+_W_PPR = qn("w:pPr")
+_W_JC = qn("w:jc")
+_W_R = qn("w:r")
+_W_RPR = qn("w:rPr")
+_W_B = qn("w:b")
+_W_COLOR = qn("w:color")
+_W_SZ = qn("w:sz")
+_W_T = qn("w:t")
+_W_TYPE = qn("w:type")
+_W_W = qn("w:w")
+_W_VAL = qn("w:val")
+_W_FILL = qn("w:fill")
+_XML_SPACE = qn("xml:space")
+
+# Default header background (corporate navy blue)
+_DEFAULT_HEADER_COLOR = RGBColor(11, 31, 59)
+
+
+@lru_cache(maxsize=64)
+def _hex_to_rgb(hex_color: str) -> RGBColor:
+    """Convert hex color to RGBColor (cached; RGBColor is an immutable tuple)."""
+    hex_color = hex_color.lstrip("#")
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    return RGBColor(r, g, b)
+
 
 class WordWriter:
-    """Writes extracted tables to Word documents."""
+    """
+    Writes extracted tables to Word documents.
+
+    Instances hold configuration only and are reused across documents.
+    """
 
     def __init__(
         self,
@@ -126,65 +165,90 @@ class WordWriter:
         if table.is_empty:
             return
 
-        # Create Word table
-        num_rows = len(table.data)
         num_cols = table.schema.column_count
 
-        word_table = doc.add_table(rows=num_rows, cols=num_cols)
+        # python-docx creates the table properties and column grid; the rows are
+        # built as XML directly, which avoids its per-cell object and DOM overhead
+        word_table = doc.add_table(rows=0, cols=num_cols)
         word_table.style = "Light Grid Accent 1"
 
-        # Fill table data
-        for row_idx, row_data in enumerate(table.data):
-            for col_idx, cell_value in enumerate(row_data):
-                if col_idx < num_cols:
-                    cell = word_table.cell(row_idx, col_idx)
-                    cell.text = str(cell_value) if cell_value else ""
+        tbl = word_table._tbl
+        grid_cols = tbl.tblGrid.gridCol_lst
+        col_width = grid_cols[0].get(_W_W) if grid_cols else "0"
 
-        # Style header row
+        header_fill = None
         if table.schema.has_header:
-            self._style_header_row(word_table)
+            # Get theme colors or use defaults
+            if self.theme:
+                header_fill = str(self._hex_to_rgb(self.theme.palette.primary))
+            else:
+                header_fill = str(_DEFAULT_HEADER_COLOR)
+
+        for row_idx, row_data in enumerate(table.data):
+            self._append_table_row(
+                tbl, row_data, num_cols, col_width, header_fill if row_idx == 0 else None
+            )
 
         # Add spacing after table
         doc.add_paragraph()
 
-    def _style_header_row(self, table: DocxTable) -> None:
-        """Apply styling to header row."""
-        if not table.rows:
-            return
-
-        header_row = table.rows[0]
-
-        # Get theme colors or use defaults
-        if self.theme:
-            bg_color = self._hex_to_rgb(self.theme.palette.primary)
-        else:
-            bg_color = RGBColor(11, 31, 59)  # Corporate navy blue
-
-        for cell in header_row.cells:
-            # Set background color
-            self._set_cell_background(cell, bg_color)
-
-            # Set text color and bold
-            for paragraph in cell.paragraphs:
-                for run in paragraph.runs:
-                    run.font.bold = True
-                    run.font.color.rgb = RGBColor(255, 255, 255)  # White
-                    run.font.size = Pt(11)
-
-                # Center align
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    @staticmethod
+    def _append_table_row(
+        tbl: CT_Tbl,
+        row_data: List[Any],
+        num_cols: int,
+        col_width: str,
+        header_fill: Optional[str] = None,
+    ) -> None:
+        """
+        Append one row to a table element.
 
-    def _set_cell_background(self, cell, color: RGBColor) -> None:
-        """Set cell background color."""
-        shading_elm = OxmlElement("w:shd")
-        shading_elm.set(qn("w:fill"), f"{color.red:02x}{color.green:02x}{color.blue:02x}")
-        cell._element.get_or_add_tcPr().append(shading_elm)
+        Args:
+            tbl: Table element (w:tbl)
+            row_data: Cell values (values past num_cols are dropped)
+            num_cols: Number of table columns
+            col_width: Cell width in twips
+            header_fill: Background hex color; styles the row as a header when set
+        """
+        tr = SubElement(tbl, _W_TR)
+        row_len = len(row_data)
+
+        for col_idx in range(num_cols):
+            tc = SubElement(tr, _W_TC)
+            tc_pr = SubElement(tc, _W_TCPR)
+            SubElement(tc_pr, _W_TCW, {_W_TYPE: "dxa", _W_W: col_width})
+            p = SubElement(tc, _W_P)
+
+            if header_fill is not None:
+                # Shaded, centered cell with bold white 11pt text
+                SubElement(tc_pr, _W_SHD, {_W_FILL: header_fill})
+                SubElement(SubElement(p, _W_PPR), _W_JC, {_W_VAL: "center"})
+
+            if col_idx >= row_len:
+                continue
+
+            r = SubElement(p, _W_R)
+            if header_fill is not None:
+                r_pr = SubElement(r, _W_RPR)
+                SubElement(r_pr, _W_B)
+                SubElement(r_pr, _W_COLOR, {_W_VAL: "FFFFFF"})
+                SubElement(r_pr, _W_SZ, {_W_VAL: "22"})
+
+            cell_value = row_data[col_idx]
+            text = "" if cell_value is None else str(cell_value)
+            if not text:
+                continue
+
+            if "\t" in text or "\n" in text or "\r" in text:
+                # python-docx turns tabs and line breaks into w:tab / w:br elements
+                r.text = text
+            else:
+                t = SubElement(r, _W_T)
+                t.text = text
+                if len(text.strip()) < len(text):
+                    t.set(_XML_SPACE, "preserve")
 
     @staticmethod
     def _hex_to_rgb(hex_color: str) -> RGBColor:
         """Convert hex color to RGBColor."""
-        hex_color = hex_color.lstrip("#")
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return RGBColor(r, g, b)
+        return _hex_to_rgb(hex_color)
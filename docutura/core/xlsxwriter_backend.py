@@ -0,0 +1,217 @@
+"""
+xlsxwriter backend for the Excel output engine.
+
+Exposes the small subset of the openpyxl workbook/worksheet API that
+ExcelWriter uses, so large exports can be streamed by xlsxwriter in
+constant-memory mode without duplicating the sheet layout code.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from openpyxl import Workbook
+from openpyxl.cell import Cell
+from openpyxl.utils import column_index_from_string
+from openpyxl.workbook.child import avoid_duplicate_name
+
+try:
+    import xlsxwriter
+
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Excel's sheet title limit; xlsxwriter rejects longer titles rather than warning
+_MAX_TITLE_LENGTH = 31
+
+
+class _ColumnDimension:
+    """Column width setter mirroring openpyxl's ColumnDimension.width."""
+
+    __slots__ = ("_worksheet", "_col_idx")
+
+    def __init__(self, worksheet: Any, col_idx: int):
+        self._worksheet = worksheet
+        self._col_idx = col_idx
+
+    @property
+    def width(self) -> None:
+        return None
+
+    @width.setter
+    def width(self, value: float) -> None:
+        # openpyxl widths are raw OOXML character widths; xlsxwriter's set_column
+        # adds cell padding, so set the equivalent pixel width (7 px per character)
+        self._worksheet.set_column_pixels(self._col_idx, self._col_idx, value * 7)
+
+
+class _ColumnDimensions:
+    """Mapping of column letters to width setters."""
+
+    def __init__(self, worksheet: Any):
+        self._worksheet = worksheet
+
+    def __getitem__(self, column_letter: str) -> _ColumnDimension:
+        return _ColumnDimension(self._worksheet, column_index_from_string(column_letter) - 1)
+
+
+class XlsxWriterSheet:
+    """Append-only worksheet backed by an xlsxwriter worksheet."""
+
+    def __init__(self, book: "XlsxWriterWorkbook", worksheet: Any):
+        self.title = worksheet.name
+        # Styled cells are built as openpyxl cells; the style registry lives here
+        self.parent = book.style_registry
+        self.column_dimensions = _ColumnDimensions(worksheet)
+        self._book = book
+        self._worksheet = worksheet
+        self._row_idx = 0
+
+    @property
+    def freeze_panes(self) -> None:
+        return None
+
+    @freeze_panes.setter
+    def freeze_panes(self, top_left_cell: str) -> None:
+        self._worksheet.freeze_panes(top_left_cell)
+
+    def append(self, row: Iterable[Any]) -> None:
+        """
+        Write the next row.
+
+        Args:
+            row: Values and/or styled openpyxl cells
+        """
+        write = self._worksheet.write
+        row_idx = self._row_idx
+
+        for col_idx, value in enumerate(row):
+            if isinstance(value, Cell):
+                cell_format = self._book.get_format(value) if value.has_style else None
+                value = value.value
+            else:
+                cell_format = None
+
+            if value is not None or cell_format is not None:
+                write(row_idx, col_idx, value, cell_format)
+
+        self._row_idx += 1
+
+
+class XlsxWriterWorkbook:
+    """Workbook facade writing through xlsxwriter in constant-memory mode."""
+
+    def __init__(self, output_path: Path):
+        """
+        Initialize workbook.
+
+        Args:
+            output_path: Output file path (only created on save)
+        """
+        if not XLSXWRITER_AVAILABLE:
+            raise ImportError(
+                "xlsxwriter is required for this Excel backend. Install it with: pip install xlsxwriter"
+            )
+
+        # xlsxwriter opens the path itself when the workbook is closed, so nothing
+        # is left at the destination if writing fails before save()
+        self._workbook = xlsxwriter.Workbook(
+            str(output_path),
+            {
+                "constant_memory": True,
+                "strings_to_numbers": False,
+                "strings_to_urls": False,
+            },
+        )
+        self.style_registry = Workbook(write_only=True)
+        self._sheets: List[XlsxWriterSheet] = []
+        self._formats: Dict[int, Any] = {}
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return [sheet.title for sheet in self._sheets]
+
+    def create_sheet(self, title: str, index: Optional[int] = None) -> XlsxWriterSheet:
+        """
+        Append a worksheet.
+
+        Args:
+            title: Sheet title; de-duplicated like openpyxl ("Dup", "Dup1") and kept
+                within Excel's 31 characters
+            index: Position for the sheet; only the next position is supported
+
+        Returns:
+            Created sheet
+        """
+        if index is not None and index != len(self._sheets):
+            raise ValueError(
+                f"xlsxwriter backend can only append sheets (index {index} requested, "
+                f"{len(self._sheets)} sheets exist)"
+            )
+
+        sheet = XlsxWriterSheet(self, self._workbook.add_worksheet(self._unique_title(title)))
+        self._sheets.append(sheet)
+        return sheet
+
+    def _unique_title(self, title: str) -> str:
+        """Make a title unique among existing sheets, shortening it to fit if needed."""
+        names = self.sheetnames
+        title = title[:_MAX_TITLE_LENGTH]
+        unique = avoid_duplicate_name(names, title)
+
+        # Leave room for the numeric suffix
+        while len(unique) > _MAX_TITLE_LENGTH:
+            title = title[:-1]
+            unique = avoid_duplicate_name(names, title)
+
+        return unique
+
+    def get_format(self, cell: Cell) -> Any:
+        """
+        Get the xlsxwriter format equivalent to a styled openpyxl cell.
+
+        Args:
+            cell: Styled cell
+
+        Returns:
+            Cached xlsxwriter Format
+        """
+        style_id = cell.style_id
+        cell_format = self._formats.get(style_id)
+        if cell_format is None:
+            cell_format = self._workbook.add_format(self._format_properties(cell))
+            self._formats[style_id] = cell_format
+        return cell_format
+
+    @staticmethod
+    def _format_properties(cell: Cell) -> Dict[str, Any]:
+        """Translate the font, fill, border and alignment ExcelWriter uses."""
+        properties: Dict[str, Any] = {}
+
+        font = cell.font
+        if font.b:
+            properties["bold"] = True
+        if font.sz and font.sz != 11:
+            properties["font_size"] = font.sz
+        if font.color is not None and isinstance(font.color.rgb, str):
+            properties["font_color"] = "#" + font.color.rgb[-6:]
+
+        fill = cell.fill
+        if fill.fill_type == "solid" and isinstance(fill.fgColor.rgb, str):
+            properties["pattern"] = 1
+            properties["bg_color"] = "#" + fill.fgColor.rgb[-6:]
+
+        if cell.border.left.style == "thin":
+            properties["border"] = 1
+
+        alignment = cell.alignment
+        if alignment.horizontal:
+            properties["align"] = alignment.horizontal
+        if alignment.vertical == "center":
+            properties["valign"] = "vcenter"
+
+        return properties
+
+    def save(self, output_path: Optional[Path] = None) -> None:
+        """Write the file given at construction."""
+        self._workbook.close()
@@ -4,14 +4,23 @@ Audit logging system for DocTura Desktop.
 Provides enterprise-grade tracking of all conversions.
 """
 
+import atexit
 import hashlib
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from docutura.core.models import ConversionResult, DocumentMetadata, ValidationReport
 
+# Index entries batched in memory before they are appended in one write
+_INDEX_BATCH_SIZE = 64
+
+# Block size for reading the index backwards from its end
+_TAIL_BLOCK_SIZE = 64 * 1024
+
 
 class AuditLogger:
     """Manages audit logs for document conversions."""
@@ -28,6 +37,12 @@ class AuditLogger:
 
         self.index_file = log_dir / "audit_index.jsonl"
 
+        # Index lines are batched and appended whole, so loggers sharing the file
+        # never interleave partial lines
+        self._index_lock = threading.Lock()
+        self._pending_index_lines: List[str] = []
+        atexit.register(self.flush)
+
     def log_conversion(
         self,
         result: ConversionResult,
@@ -91,10 +106,12 @@ class AuditLogger:
         if user_metadata:
             log_entry["user_metadata"] = user_metadata
 
-        # Write detailed log file
+        # Write detailed log file (encoded in full first: one write, not one per token),
+        # published atomically so a crash never leaves a truncated log behind
         log_file = self.log_dir / f"{log_id}.json"
-        with open(log_file, "w", encoding="utf-8") as f:
-            json.dump(log_entry, f, indent=2)
+        tmp_file = log_file.with_name(f"{log_file.name}.tmp")
+        tmp_file.write_text(json.dumps(log_entry, indent=2), encoding="utf-8")
+        os.replace(tmp_file, log_file)
 
         # Append to index
         self._append_to_index(log_entry)
@@ -105,18 +122,13 @@ class AuditLogger:
         """Generate unique log ID."""
         base = f"{input_file.name}_{timestamp.strftime('%Y%m%d_%H%M%S')}"
         # Add short hash for uniqueness
-        hash_val = hashlib.md5(f"{input_file}_{timestamp}".encode()).hexdigest()[:8]
+        hash_val = hashlib.blake2b(f"{input_file}_{timestamp}".encode(), digest_size=4).hexdigest()
         return f"{base}_{hash_val}"
 
     def _compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA-256 hash of file."""
-        sha256 = hashlib.sha256()
-
         try:
-            with open(file_path, "rb") as f:
-                while chunk := f.read(8192):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+            return DocumentMetadata.compute_hash(file_path)
         except Exception:
             return "error"
 
@@ -132,8 +144,25 @@ class AuditLogger:
             "success": log_entry["success"],
         }
 
+        with self._index_lock:
+            self._pending_index_lines.append(json.dumps(index_entry) + "\n")
+            if len(self._pending_index_lines) >= _INDEX_BATCH_SIZE:
+                self._write_pending_index()
+
+    def flush(self) -> None:
+        """Append batched index entries to the index file."""
+        with self._index_lock:
+            self._write_pending_index()
+
+    def _write_pending_index(self) -> None:
+        """Write batched index lines in one append (caller holds the lock)."""
+        if not self._pending_index_lines:
+            return
+
         with open(self.index_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(index_entry) + "\n")
+            f.write("".join(self._pending_index_lines))
+
+        self._pending_index_lines.clear()
 
     def get_recent_logs(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -145,17 +174,40 @@ class AuditLogger:
         Returns:
             List of log entries (most recent first)
         """
+        self.flush()
+
         if not self.index_file.exists():
             return []
 
-        entries = []
-        with open(self.index_file, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    entries.append(json.loads(line))
+        if limit <= 0:
+            # Slice semantics of the full read ([-0:] is every entry)
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+            return list(reversed(entries[-limit:]))
+
+        # Read backwards from the end so only the requested entries are parsed
+        entries: List[Dict[str, Any]] = []
+        with open(self.index_file, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            partial = b""
 
-        # Return most recent entries
-        return list(reversed(entries[-limit:]))
+            while pos > 0 and len(entries) < limit:
+                step = min(_TAIL_BLOCK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + partial).split(b"\n")
+
+                # The first line may continue in the block before this one
+                partial = lines.pop(0) if pos > 0 else b""
+
+                for line in reversed(lines):
+                    if line.strip():
+                        entries.append(json.loads(line))
+                        if len(entries) == limit:
+                            break
+
+        # Most recent entries first
+        return entries
 
     def search_logs(
         self,
@@ -176,6 +228,8 @@ class AuditLogger:
         Returns:
             Matching log entries
         """
+        self.flush()
+
         if not self.index_file.exists():
             return []
 
@@ -6,7 +6,7 @@ Defines plugin interface and registry.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from docutura.core.models import (
     DocumentMetadata,
@@ -25,6 +25,31 @@ class PluginDetectionResult:
     metadata: Dict[str, Any]  # Plugin-specific metadata
 
 
+@dataclass(frozen=True)
+class PluginManifest:
+    """
+    Cheap description of which documents a plugin may handle.
+
+    Used by the registry to skip instantiating plugins that cannot match.
+    Empty tuples match everything.
+    """
+
+    file_types: Tuple[str, ...] = ()  # Values of context["file_type"]
+    keywords: Tuple[str, ...] = ()  # Upper-case hints looked up in text and header rows
+
+    def matches(self, file_type: str, haystacks: Tuple[str, ...]) -> bool:
+        """Check whether a document could be handled by the plugin."""
+        if self.file_types and file_type not in self.file_types:
+            return False
+
+        if self.keywords:
+            return any(
+                keyword in haystack for haystack in haystacks for keyword in self.keywords
+            )
+
+        return True
+
+
 class DocumentPlugin(ABC):
     """Base class for document processing plugins."""
 
@@ -32,6 +57,16 @@ class DocumentPlugin(ABC):
         self.plugin_id = self.get_plugin_id()
         self.version = self.get_version()
 
+    @classmethod
+    def manifest(cls) -> PluginManifest:
+        """
+        Get detection hints that are available without instantiating the plugin.
+
+        Returns:
+            Plugin manifest (matches every document by default)
+        """
+        return PluginManifest()
+
     @abstractmethod
     def get_plugin_id(self) -> str:
         """Get unique plugin identifier."""
@@ -55,7 +90,8 @@ class DocumentPlugin(ABC):
         Args:
             tables_data: Raw extracted tables
             page_texts: Text from each page
-            context: Extraction context
+            context: Extraction context; the controller adds "full_text" (page texts
+                joined by spaces) and "full_text_upper" so plugins need not rebuild them
 
         Returns:
             Detection result with confidence score
@@ -89,7 +125,9 @@ class DocumentPlugin(ABC):
         Args:
             tables_data: Raw extracted tables
             page_texts: Text from each page
-            context: Extraction context
+            context: Extraction context; when called after detection it also holds
+                "detection_metadata", the metadata of this plugin's detection result,
+                plus the "full_text"/"full_text_upper" keys described for detect
 
         Returns:
             Document metadata
@@ -136,11 +174,52 @@ class PluginRegistry:
     """Registry for managing document plugins."""
 
     def __init__(self):
-        self.plugins: List[DocumentPlugin] = []
+        self._factories: Dict[str, Callable[[], DocumentPlugin]] = {}
+        self._manifests: Dict[str, PluginManifest] = {}
+        self._instances: Dict[str, DocumentPlugin] = {}
+
+    def register(
+        self,
+        plugin: Union[DocumentPlugin, str],
+        factory: Optional[Callable[[], DocumentPlugin]] = None,
+    ) -> None:
+        """
+        Register a plugin.
 
-    def register(self, plugin: DocumentPlugin) -> None:
-        """Register a plugin."""
-        self.plugins.append(plugin)
+        Args:
+            plugin: Plugin instance, or plugin ID when registering a factory
+            factory: Zero-argument callable (usually the plugin class) that
+                creates the plugin on first use
+        """
+        if isinstance(plugin, DocumentPlugin):
+            plugin_id = plugin.get_plugin_id()
+            self._instances[plugin_id] = plugin
+            self._factories[plugin_id] = type(plugin)
+            self._manifests[plugin_id] = plugin.manifest()
+            return
+
+        if factory is None:
+            raise ValueError(f"A factory is required to register plugin '{plugin}'")
+
+        manifest = getattr(factory, "manifest", None)
+        self._factories[plugin] = factory
+        self._manifests[plugin] = manifest() if manifest else PluginManifest()
+
+    def _get_instance(self, plugin_id: str) -> DocumentPlugin:
+        """Get plugin instance, creating it on first use."""
+        plugin = self._instances.get(plugin_id)
+        if plugin is None:
+            plugin = self._factories[plugin_id]()
+
+            # Factories are registered under an ID given by the caller; it must be
+            # the one the plugin reports, or results would be filed under another ID
+            if plugin.get_plugin_id() != plugin_id:
+                raise ValueError(
+                    f"Plugin registered as '{plugin_id}' reports ID '{plugin.get_plugin_id()}'"
+                )
+
+            plugin = self._instances.setdefault(plugin_id, plugin)
+        return plugin
 
     def detect_plugin(
         self,
@@ -148,6 +227,7 @@ class PluginRegistry:
         page_texts: List[str],
         context: Dict[str, Any],
         min_confidence: float = 0.5,
+        sufficient_confidence: float = 1.0,
     ) -> Optional[Tuple[DocumentPlugin, PluginDetectionResult]]:
         """
         Detect which plugin should handle the document.
@@ -157,6 +237,8 @@ class PluginRegistry:
             page_texts: Text from each page
             context: Extraction context
             min_confidence: Minimum confidence threshold
+            sufficient_confidence: Stop at the first plugin reaching this confidence
+                (the default 1.0 cannot be beaten, so the choice is unchanged)
 
         Returns:
             Tuple of (plugin, detection_result) or None
@@ -165,17 +247,29 @@ class PluginRegistry:
         best_result = None
         best_confidence = 0.0
 
-        for plugin in self.plugins:
+        file_type = context.get("file_type", "")
+        haystacks = self._build_haystacks(
+            tables_data, page_texts, context.get("full_text_upper")
+        )
+
+        for plugin_id in self._factories:
+            if not self._manifests[plugin_id].matches(file_type, haystacks):
+                continue
+
             try:
+                plugin = self._get_instance(plugin_id)
                 result = plugin.detect(tables_data, page_texts, context)
 
                 if result.confidence > best_confidence and result.confidence >= min_confidence:
                     best_confidence = result.confidence
                     best_plugin = plugin
                     best_result = result
+
+                    if best_confidence >= sufficient_confidence:
+                        break
             except Exception as e:
                 # Log error and continue
-                print(f"Error in plugin {plugin.get_plugin_id()}: {e}")
+                print(f"Error in plugin {plugin_id}: {e}")
                 continue
 
         if best_plugin and best_result:
@@ -183,13 +277,34 @@ class PluginRegistry:
 
         return None
 
+    @staticmethod
+    def _build_haystacks(
+        tables_data: List[Dict[str, Any]],
+        page_texts: List[str],
+        full_text_upper: Optional[str] = None,
+    ) -> Tuple[str, str]:
+        """
+        Build upper-case page text and table header text for manifest hints.
+
+        The two are kept apart so the (possibly large) page text is not copied again.
+        """
+        header_text = " ".join(
+            " ".join(str(cell) for cell in table_dict["data"][0])
+            for table_dict in tables_data
+            if table_dict.get("data")
+        ).upper()
+
+        if full_text_upper is None:
+            full_text_upper = " ".join(page_texts).upper()
+
+        return full_text_upper, header_text
+
     def get_plugin_by_id(self, plugin_id: str) -> Optional[DocumentPlugin]:
         """Get plugin by ID."""
-        for plugin in self.plugins:
-            if plugin.get_plugin_id() == plugin_id:
-                return plugin
-        return None
+        if plugin_id not in self._factories:
+            return None
+        return self._get_instance(plugin_id)
 
     def list_plugins(self) -> List[str]:
         """List all registered plugin IDs."""
-        return [plugin.get_plugin_id() for plugin in self.plugins]
+        return list(self._factories)
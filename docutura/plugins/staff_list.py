@@ -5,15 +5,44 @@ Handles roster-style documents with repeated headers and section grouping.
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 
 from docutura.core.models import DocumentMetadata, SegmentationStrategy
-from docutura.plugins.base import DocumentPlugin, PluginDetectionResult
+from docutura.plugins.base import DocumentPlugin, PluginDetectionResult, PluginManifest
+
+# Reporting year, document title and organization name in the page text
+_YEAR_RE = re.compile(r"\b(20\d{2})\b")
+_TITLE_RE = re.compile(r"(INTERNATIONAL\s+STAFF\s+LIST.*?(?:\d{4})?)", re.IGNORECASE)
+_ORG_RE = re.compile(
+    r"(?:SCHOOL|COLLEGE|UNIVERSITY|ORGANIZATION)[:\s]+([A-Z\s&]+)", re.IGNORECASE
+)
+
+# Page-text indicators and header keywords, matched as substrings; indicators may
+# overlap ("INTERNATIONAL STAFF LIST" holds two), so each gets its own str scan
+_STAFF_INDICATORS = ("STAFF LIST", "STAFF ROSTER", "INTERNATIONAL STAFF", "PERSONNEL")
+_ROSTER_KEYWORDS = ("NAME", "POSITION", "DEPARTMENT", "NATIONALITY")
 
 
 class InternationalStaffListPlugin(DocumentPlugin):
     """Plugin for international staff list documents."""
 
+    @classmethod
+    def manifest(cls) -> PluginManifest:
+        """Staff indicators or roster headers are needed to reach the confidence threshold."""
+        return PluginManifest(
+            keywords=(
+                "STAFF LIST",
+                "STAFF ROSTER",
+                "INTERNATIONAL STAFF",
+                "PERSONNEL",
+                "NAME",
+                "POSITION",
+                "DEPARTMENT",
+                "NATIONALITY",
+            )
+        )
+
     def get_plugin_id(self) -> str:
         return "international_staff_list"
 
@@ -38,25 +67,25 @@ class InternationalStaffListPlugin(DocumentPlugin):
         confidence = 0.0
         metadata = {}
 
-        # Join all page texts
-        full_text = " ".join(page_texts).upper()
+        # All page text, upper-cased (prepared once by the controller when available)
+        full_text = context.get("full_text_upper")
+        if full_text is None:
+            full_text = " ".join(page_texts).upper()
 
         # Check for staff list indicators
-        staff_indicators = ["STAFF LIST", "STAFF ROSTER", "INTERNATIONAL STAFF", "PERSONNEL"]
-        indicator_matches = sum(1 for ind in staff_indicators if ind in full_text)
+        indicator_matches = sum(1 for ind in _STAFF_INDICATORS if ind in full_text)
 
         if indicator_matches > 0:
             confidence += 0.3 * min(indicator_matches, 2)
 
         # Check for roster-style headers
-        roster_keywords = ["NAME", "POSITION", "DEPARTMENT", "NATIONALITY"]
         keyword_count = 0
 
         for table_dict in tables_data:
             data = table_dict.get("data", [])
             if data:
                 first_row = " ".join(str(cell).upper() for cell in data[0])
-                keyword_count += sum(1 for kw in roster_keywords if kw in first_row)
+                keyword_count += sum(1 for kw in _ROSTER_KEYWORDS if kw in first_row)
 
         if keyword_count >= 2:  # At least 2 of the keywords
             confidence += 0.3
@@ -67,10 +96,12 @@ class InternationalStaffListPlugin(DocumentPlugin):
             confidence += 0.4
             metadata["header_pattern"] = list(header_pattern)
 
-        # Extract year if present
-        year_match = re.search(r"\b(20\d{2})\b", full_text)
-        if year_match:
-            metadata["year"] = year_match.group(1)
+        # Extract year if present (a zero-confidence result is never selected, so
+        # the text is only scanned when the document may be a staff list)
+        if confidence > 0:
+            year_match = next(filter(None, map(_YEAR_RE.search, page_texts)), None)
+            if year_match:
+                metadata["year"] = year_match.group(1)
 
         return PluginDetectionResult(
             plugin_id=self.plugin_id, confidence=min(confidence, 1.0), metadata=metadata
@@ -87,25 +118,25 @@ class InternationalStaffListPlugin(DocumentPlugin):
         context: Dict[str, Any],
     ) -> DocumentMetadata:
         """Extract staff list metadata."""
-        full_text = " ".join(page_texts)
+        full_text = context.get("full_text")
+        if full_text is None:
+            full_text = " ".join(page_texts)
 
         # Extract title
-        title_match = re.search(
-            r"(INTERNATIONAL\s+STAFF\s+LIST.*?(?:\d{4})?)", full_text, re.IGNORECASE
-        )
+        title_match = _TITLE_RE.search(full_text)
         title = title_match.group(1).strip() if title_match else "International Staff List"
 
         # Extract organization
-        org_match = re.search(
-            r"(?:SCHOOL|COLLEGE|UNIVERSITY|ORGANIZATION)[:\s]+([A-Z\s&]+)",
-            full_text,
-            re.IGNORECASE,
-        )
+        org_match = _ORG_RE.search(full_text)
         organization = org_match.group(1).strip() if org_match else None
 
-        # Extract year
-        year_match = re.search(r"\b(20\d{2})\b", full_text)
-        year = year_match.group(1) if year_match else None
+        # Extract year (detect has already searched for it when it ran first)
+        detection_metadata = context.get("detection_metadata")
+        if detection_metadata is not None:
+            year = detection_metadata.get("year")
+        else:
+            year_match = _YEAR_RE.search(full_text)
+            year = year_match.group(1) if year_match else None
 
         return DocumentMetadata(
             title=title,
@@ -119,21 +150,20 @@ class InternationalStaffListPlugin(DocumentPlugin):
         self, tables_data: List[Dict[str, Any]]
     ) -> Optional[tuple]:
         """Find repeated header pattern in tables."""
-        header_counts: Dict[tuple, int] = {}
+        header_counts: Counter[Tuple[str, ...]] = Counter()
 
         for table_dict in tables_data:
-            data = table_dict.get("data", [])
-            for row in data:
-                if row and all(cell and str(cell).strip() for cell in row):
-                    row_tuple = tuple(str(cell).strip().upper() for cell in row)
-                    header_counts[row_tuple] = header_counts.get(row_tuple, 0) + 1
-
-        # Find most repeated pattern (appears 2+ times)
-        for pattern, count in header_counts.items():
-            if count >= 2:
-                return pattern
-
-        return None
+            for row in table_dict.get("data", ()):
+                # Only fully populated rows can be headers (cells stripped once)
+                if not row or not all(row):
+                    continue
+                stripped = [str(cell).strip() for cell in row]
+                if all(stripped):
+                    header_counts[tuple(map(str.upper, stripped))] += 1
+
+        # First-seen pattern that appears 2+ times (counting must finish: a row
+        # seen earlier may still repeat after another pattern reaches 2)
+        return next((pattern for pattern, count in header_counts.items() if count >= 2), None)
 
     def summarize(self, tables: List["ExtractedTable"]) -> Optional[str]:
         """Generate summary of staff list data."""
@@ -8,12 +8,73 @@ import re
 from typing import Any, Dict, List, Optional
 
 from docutura.core.models import DocumentMetadata, ScoreDomain, SegmentationStrategy
-from docutura.plugins.base import DocumentPlugin, PluginDetectionResult
+from docutura.plugins.base import DocumentPlugin, PluginDetectionResult, PluginManifest
+
+# Subject, session and report title in the page text; detection reads the subject
+# from uppercased text to the end of the letters, metadata extraction up to a gap
+_SUBJECT_RE = re.compile(r"SUBJECT[:\s]+([A-Z\s]+)")
+_SUBJECT_FIELD_RE = re.compile(r"SUBJECT[:\s]+([A-Z\s]+?)(?:\s{2,}|\n|$)")
+_SESSION_RE = re.compile(r"(?:SESSION|YEAR)[:\s]+(\d{4})")
+_TITLE_RE = re.compile(r"(TASS|CASS)\s+(?:AND\s+)?(TASS|CASS)?\s*.*?STATISTICS", re.IGNORECASE)
+
+# Page-text indicators and distribution header keywords, matched as substrings
+_WAEC_INDICATORS = ("WAEC", "WEST AFRICAN EXAMINATIONS COUNCIL", "TASS", "CASS")
+_DISTRIBUTION_KEYWORDS = ("FREQUENCY", "PERCENT", "CUMULATIVE", "SCORE")
+
+# Standard WAEC score ranges, built once (segmentation only reads them)
+_SCORE_DOMAINS = (
+    ScoreDomain(
+        name="Scaled_Objective",
+        min_score=0,
+        max_score=19,
+        description="Scaled Objective score range (0-19)",
+    ),
+    ScoreDomain(
+        name="Scaled_Essay",
+        min_score=15,
+        max_score=40,
+        description="Scaled Essay score range (15-40)",
+    ),
+    ScoreDomain(
+        name="Raw_Score_40",
+        min_score=0,
+        max_score=40,
+        description="Raw score range (0-40)",
+    ),
+    ScoreDomain(
+        name="Raw_Score_50",
+        min_score=0,
+        max_score=50,
+        description="Raw score range (0-50)",
+    ),
+    ScoreDomain(
+        name="Raw_Score_60",
+        min_score=0,
+        max_score=60,
+        description="Raw score range (0-60)",
+    ),
+)
 
 
 class WAECMarksDistributionPlugin(DocumentPlugin):
     """Plugin for WAEC marks distribution reports."""
 
+    @classmethod
+    def manifest(cls) -> PluginManifest:
+        """Report indicators or distribution headers are needed to reach the confidence threshold."""
+        return PluginManifest(
+            keywords=(
+                "WAEC",
+                "WEST AFRICAN EXAMINATIONS COUNCIL",
+                "TASS",
+                "CASS",
+                "FREQUENCY",
+                "PERCENT",
+                "CUMULATIVE",
+                "SCORE",
+            )
+        )
+
     def get_plugin_id(self) -> str:
         return "waec_marksdist"
 
@@ -37,55 +98,51 @@ class WAECMarksDistributionPlugin(DocumentPlugin):
         confidence = 0.0
         metadata = {}
 
-        # Join all page texts
-        full_text = " ".join(page_texts).upper()
-
-        # Check for WAEC indicators
-        waec_indicators = ["WAEC", "WEST AFRICAN EXAMINATIONS COUNCIL", "TASS", "CASS"]
-        indicator_matches = sum(1 for ind in waec_indicators if ind in full_text)
+        # All page text, upper-cased (prepared once by the controller when available)
+        full_text = context.get("full_text_upper")
+        if full_text is None:
+            full_text = " ".join(page_texts).upper()
+
+        # Check for WAEC indicators (only the first two count, so stop scanning there)
+        indicator_matches = 0
+        for ind in _WAEC_INDICATORS:
+            if ind in full_text:
+                indicator_matches += 1
+                if indicator_matches == 2:
+                    break
 
         if indicator_matches > 0:
-            confidence += 0.3 * min(indicator_matches, 2)
+            confidence += 0.3 * indicator_matches
 
         # Check for statistical distribution headers
-        distribution_keywords = ["FREQUENCY", "PERCENT", "CUMULATIVE", "SCORE"]
         keyword_count = 0
 
         for table_dict in tables_data:
             data = table_dict.get("data", [])
             if data:
                 first_row = " ".join(str(cell).upper() for cell in data[0])
-                keyword_count += sum(1 for kw in distribution_keywords if kw in first_row)
+                keyword_count += sum(1 for kw in _DISTRIBUTION_KEYWORDS if kw in first_row)
+                if keyword_count >= 3:
+                    break
 
         if keyword_count >= 3:  # At least 3 of the 4 keywords
             confidence += 0.4
 
-        # Check for score columns (numeric first column)
-        has_score_column = False
-        for table_dict in tables_data:
-            data = table_dict.get("data", [])
-            if len(data) > 1:
-                # Check if first column has numeric values
-                numeric_count = 0
-                for row in data[1:]:
-                    if row:
-                        try:
-                            float(str(row[0]).replace(",", ""))
-                            numeric_count += 1
-                        except (ValueError, IndexError):
-                            pass
-
-                if numeric_count > len(data[1:]) * 0.7:
-                    has_score_column = True
+        # Check for score columns (numeric first column), unless confidence is
+        # already at its 1.0 cap
+        if confidence < 1.0:
+            for table_dict in tables_data:
+                data = table_dict.get("data", [])
+                if len(data) > 1 and self._has_numeric_first_column(data):
                     confidence += 0.3
                     break
 
         # Extract subject/document info
-        subject_match = re.search(r"SUBJECT[:\s]+([A-Z\s]+)", full_text)
+        subject_match = _SUBJECT_RE.search(full_text)
         if subject_match:
             metadata["subject"] = subject_match.group(1).strip()
 
-        session_match = re.search(r"(?:SESSION|YEAR)[:\s]+(\d{4})", full_text)
+        session_match = _SESSION_RE.search(full_text)
         if session_match:
             metadata["session"] = session_match.group(1)
 
@@ -99,6 +156,30 @@ class WAECMarksDistributionPlugin(DocumentPlugin):
             plugin_id=self.plugin_id, confidence=min(confidence, 1.0), metadata=metadata
         )
 
+    @staticmethod
+    def _has_numeric_first_column(data: List[List[Any]]) -> bool:
+        """Check if more than 70% of the data rows (after the header) start with a number."""
+        rows_left = len(data) - 1
+        needed = rows_left * 0.7
+        numeric_count = 0
+
+        for row in data[1:]:
+            rows_left -= 1
+            if row:
+                try:
+                    float(str(row[0]).replace(",", ""))
+                    numeric_count += 1
+                except (ValueError, IndexError):
+                    pass
+
+            # Stop once the remaining rows cannot change the outcome
+            if numeric_count > needed:
+                return True
+            if numeric_count + rows_left <= needed:
+                return False
+
+        return False
+
     def get_segmentation_strategy(self) -> SegmentationStrategy:
         """Use score-domain segmentation to prevent truncation."""
         return SegmentationStrategy.SCORE_DOMAIN
@@ -109,38 +190,7 @@ class WAECMarksDistributionPlugin(DocumentPlugin):
 
         These are the standard WAEC score ranges that must not be split across pages.
         """
-        return [
-            ScoreDomain(
-                name="Scaled_Objective",
-                min_score=0,
-                max_score=19,
-                description="Scaled Objective score range (0-19)",
-            ),
-            ScoreDomain(
-                name="Scaled_Essay",
-                min_score=15,
-                max_score=40,
-                description="Scaled Essay score range (15-40)",
-            ),
-            ScoreDomain(
-                name="Raw_Score_40",
-                min_score=0,
-                max_score=40,
-                description="Raw score range (0-40)",
-            ),
-            ScoreDomain(
-                name="Raw_Score_50",
-                min_score=0,
-                max_score=50,
-                description="Raw score range (0-50)",
-            ),
-            ScoreDomain(
-                name="Raw_Score_60",
-                min_score=0,
-                max_score=60,
-                description="Raw score range (0-60)",
-            ),
-        ]
+        return list(_SCORE_DOMAINS)
 
     def extract_metadata(
         self,
@@ -149,20 +199,20 @@ class WAECMarksDistributionPlugin(DocumentPlugin):
         context: Dict[str, Any],
     ) -> DocumentMetadata:
         """Extract WAEC document metadata."""
-        full_text = " ".join(page_texts)
+        full_text = context.get("full_text")
+        if full_text is None:
+            full_text = " ".join(page_texts)
 
         # Extract title
-        title_match = re.search(
-            r"(TASS|CASS)\s+(?:AND\s+)?(TASS|CASS)?\s*.*?STATISTICS", full_text, re.IGNORECASE
-        )
+        title_match = _TITLE_RE.search(full_text)
         title = title_match.group(0) if title_match else "WAEC Marks Distribution"
 
         # Extract subject
-        subject_match = re.search(r"SUBJECT[:\s]+([A-Z\s]+?)(?:\s{2,}|\n|$)", full_text)
+        subject_match = _SUBJECT_FIELD_RE.search(full_text)
         subject = subject_match.group(1).strip() if subject_match else None
 
         # Extract session/year
-        session_match = re.search(r"(?:SESSION|YEAR)[:\s]+(\d{4})", full_text)
+        session_match = _SESSION_RE.search(full_text)
         session = session_match.group(1) if session_match else None
 
         return DocumentMetadata(
@@ -176,13 +226,11 @@ class WAECMarksDistributionPlugin(DocumentPlugin):
 
     def summarize(self, tables: List["ExtractedTable"]) -> Optional[str]:
         """Generate summary of WAEC distribution data."""
-        summaries = []
-
-        for table in tables:
-            if table.score_domain:
-                summaries.append(
-                    f"- {table.score_domain.name}: {table.row_count - 1} score entries"
-                )
+        summaries = [
+            f"- {table.score_domain.name}: {table.row_count - 1} score entries"
+            for table in tables
+            if table.score_domain
+        ]
 
         if summaries:
             return "WAEC Marks Distribution Summary:\n" + "\n".join(summaries)
@@ -64,6 +64,72 @@ class TestValidation:
         validator = TableValidator(tolerance=0.01)
         assert validator.tolerance == 0.01
 
+    def test_column_count_issues_are_capped(self):
+        """Test column-count mismatches are summarized after the first few rows."""
+        from docutura.core.models import ExtractedTable, TableSchema
+        from docutura.core.validator import TableValidator
+
+        data = [["Code", "Title"]] + [["X"] for _ in range(8)]
+        table = ExtractedTable(
+            data=data,
+            schema=TableSchema(headers=data[0], column_count=2),
+            source_pages=[1],
+            table_type="logical",
+        )
+
+        report = TableValidator().validate_tables([table])
+        column_issues = [i for i in report.issues if "column count" in i.message]
+
+        assert len(column_issues) == 6
+        assert column_issues[-1].details["additional_rows"] == 3
+
+
+class TestAnalysisCache:
+    """Test analysis cache serialization."""
+
+    def test_analysis_round_trips_through_json(self):
+        """Test cached tables and reports survive a JSON round trip unchanged."""
+        import json
+
+        from docutura.core.analysis_cache import decode_analysis, encode_analysis
+        from docutura.core.models import (
+            ExtractedTable,
+            SegmentationStrategy,
+            TableSchema,
+            ValidationIssue,
+            ValidationReport,
+            ValidationStatus,
+        )
+
+        table = ExtractedTable(
+            data=[["Score", "Frequency"], ["0", "12"]],
+            schema=TableSchema(headers=["Score", "Frequency"], column_count=2),
+            source_pages=[1, 2],
+            table_type="logical",
+            segmentation_strategy=SegmentationStrategy.SCORE_DOMAIN,
+            score_domain=ScoreDomain(name="Raw_Score_40", min_score=0, max_score=40),
+        )
+        report = ValidationReport(
+            overall_status=ValidationStatus.PASSED,
+            issues=[],
+            tables_validated=1,
+            tables_passed=1,
+            tables_with_warnings=0,
+            tables_failed=0,
+        )
+        report.add_issue(
+            ValidationIssue(
+                severity=ValidationStatus.WARNING,
+                message="Percent column does not sum to 100",
+                table_name="Table 1",
+                details={"total": 99.5},
+            )
+        )
+
+        entry = json.loads(json.dumps(encode_analysis([table], report)))
+
+        assert decode_analysis(entry) == ([table], report)
+
 
 class TestNaming:
     """Test smart naming engine."""
@@ -92,39 +158,192 @@ class TestNaming:
         assert len(result) <= 100
 
 
+class TestCSVWriter:
+    """Test CSV output."""
+
+    def test_fast_path_matches_csv_module(self, tmp_path):
+        """Test preformatted CSV output is identical to csv.writer output."""
+        import csv
+
+        from docutura.core.csv_writer import CSVWriter
+        from docutura.core.models import ExtractedTable, TableSchema
+
+        data = [
+            ["Score", "Name, Full", 'Quote "x"'],
+            ["1", "", "multi\nline"],
+            [""],
+            [],
+            ["", "", ""],
+        ]
+        table = ExtractedTable(
+            data=data,
+            schema=TableSchema(headers=data[0], column_count=3),
+            source_pages=[1],
+            table_type="logical",
+        )
+
+        output_path = CSVWriter().write_tables_to_csv(tmp_path, [table])[0]
+
+        expected_path = tmp_path / "expected.csv"
+        with open(expected_path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(data)
+
+        assert output_path.read_bytes() == expected_path.read_bytes()
+
+
+class TestExcelWriter:
+    """Test Excel output."""
+
+    def test_xlsxwriter_backend_round_trip(self, tmp_path):
+        """Test the xlsxwriter backend writes data openpyxl reads back unchanged."""
+        pytest.importorskip("xlsxwriter")
+        from openpyxl import load_workbook
+
+        from docutura.core.excel_writer import ExcelWriter
+        from docutura.core.models import ExtractedTable, TableSchema
+
+        data = [["Score", "Frequency"], ["0", "12"], ["1", "7"]]
+        table = ExtractedTable(
+            data=data,
+            schema=TableSchema(headers=data[0], column_count=2),
+            source_pages=[1],
+            table_type="page",
+        )
+
+        output_path = tmp_path / "out.xlsx"
+        ExcelWriter(backend="xlsxwriter").write_to_excel(output_path, [table], [])
+
+        ws = load_workbook(output_path)["Page_01"]
+        assert [list(row) for row in ws.iter_rows(values_only=True)] == data
+
+    def test_xlsxwriter_backend_duplicate_sheet_titles(self, tmp_path):
+        """Test same-titled tables get openpyxl-style unique sheet names."""
+        pytest.importorskip("xlsxwriter")
+        from openpyxl import load_workbook
+
+        from docutura.core.excel_writer import ExcelWriter
+        from docutura.core.models import ExtractedTable, TableSchema
+
+        tables = [
+            ExtractedTable(
+                data=[["Name"], [name]],
+                schema=TableSchema(headers=["Name"], column_count=1),
+                source_pages=[1],
+                table_type="logical",
+                section_title="Mathematics Department Staff Roster",
+            )
+            for name in ("A", "B")
+        ]
+
+        output_path = tmp_path / "out.xlsx"
+        ExcelWriter(backend="xlsxwriter").write_to_excel(output_path, [], tables)
+
+        names = load_workbook(output_path).sheetnames
+        assert len(names) == 2
+        assert len(set(names)) == 2
+        assert all(len(name) <= 31 for name in names)
+
+
+class TestWordWriter:
+    """Test Word output."""
+
+    def test_zero_values_are_written(self, tmp_path):
+        """Test numeric zero cells are written rather than left blank."""
+        from docx import Document
+
+        from docutura.core.models import ExtractedTable, TableSchema
+        from docutura.core.word_writer import WordWriter
+
+        data = [["Score", "Frequency"], [0, 0.0], [None, ""]]
+        table = ExtractedTable(
+            data=data,
+            schema=TableSchema(headers=data[0], column_count=2),
+            source_pages=[1],
+            table_type="logical",
+        )
+
+        output_path = tmp_path / "out.docx"
+        WordWriter().write_to_word(output_path, [table])
+
+        cells = [[cell.text for cell in row.cells] for row in Document(output_path).tables[0].rows]
+        assert cells == [["Score", "Frequency"], ["0", "0.0"], ["", ""]]
+
+
+@pytest.fixture(scope="module")
+def waec_plugin():
+    """WAEC plugin instance shared by the module (plugins hold no per-document state)."""
+    from docutura.plugins.waec_marksdist import WAECMarksDistributionPlugin
+
+    return WAECMarksDistributionPlugin()
+
+
+@pytest.fixture(scope="module")
+def staff_list_plugin():
+    """Staff list plugin instance shared by the module."""
+    from docutura.plugins.staff_list import InternationalStaffListPlugin
+
+    return InternationalStaffListPlugin()
+
+
 class TestPlugins:
     """Test plugin system."""
 
-    def test_plugin_registry(self):
+    def test_plugin_registry(self, waec_plugin):
         """Test plugin registry."""
         from docutura.plugins.base import PluginRegistry
-        from docutura.plugins.waec_marksdist import WAECMarksDistributionPlugin
 
         registry = PluginRegistry()
-        plugin = WAECMarksDistributionPlugin()
-
-        registry.register(plugin)
+        registry.register(waec_plugin)
 
         assert len(registry.list_plugins()) == 1
         assert "waec_marksdist" in registry.list_plugins()
 
-    def test_waec_plugin_id(self):
-        """Test WAEC plugin identification."""
+    def test_plugin_registry_lazy_factory(self):
+        """Test factories are only instantiated when their manifest matches."""
+        from docutura.plugins.base import PluginRegistry
         from docutura.plugins.waec_marksdist import WAECMarksDistributionPlugin
 
-        plugin = WAECMarksDistributionPlugin()
+        created = []
 
-        assert plugin.get_plugin_id() == "waec_marksdist"
-        assert plugin.get_version() == "1.0.0"
+        def factory():
+            created.append(1)
+            return WAECMarksDistributionPlugin()
 
-    def test_staff_list_plugin_id(self):
-        """Test staff list plugin identification."""
-        from docutura.plugins.staff_list import InternationalStaffListPlugin
+        factory.manifest = WAECMarksDistributionPlugin.manifest
 
-        plugin = InternationalStaffListPlugin()
+        registry = PluginRegistry()
+        registry.register("waec_marksdist", factory)
 
-        assert plugin.get_plugin_id() == "international_staff_list"
-        assert plugin.get_version() == "1.0.0"
+        assert registry.list_plugins() == ["waec_marksdist"]
+        assert created == []
+
+        registry.detect_plugin([], ["Unrelated memo"], {"file_type": "pdf"})
+        assert created == []
+
+        registry.detect_plugin([], ["WAEC TASS report"], {"file_type": "pdf"})
+        registry.detect_plugin([], ["WAEC TASS report"], {"file_type": "pdf"})
+        assert created == [1]
+
+    def test_plugin_registry_rejects_mismatched_id(self):
+        """Test a factory registered under another plugin's ID is rejected when built."""
+        from docutura.plugins.base import PluginRegistry
+        from docutura.plugins.waec_marksdist import WAECMarksDistributionPlugin
+
+        registry = PluginRegistry()
+        registry.register("waec_marks", WAECMarksDistributionPlugin)
+
+        with pytest.raises(ValueError):
+            registry.get_plugin_by_id("waec_marks")
+
+    def test_waec_plugin_id(self, waec_plugin):
+        """Test WAEC plugin identification."""
+        assert waec_plugin.get_plugin_id() == "waec_marksdist"
+        assert waec_plugin.get_version() == "1.0.0"
+
+    def test_staff_list_plugin_id(self, staff_list_plugin):
+        """Test staff list plugin identification."""
+        assert staff_list_plugin.get_plugin_id() == "international_staff_list"
+        assert staff_list_plugin.get_version() == "1.0.0"
 
 
 if __name__ == "__main__":
@@ -1,27 +1,24 @@
 """
 Quick test script to verify DocTura conversion works.
 
-Usage: python test_conversion.py <path_to_pdf>
+Usage: python test_conversion.py <path_to_pdf> [<path_to_pdf> ...]
 """
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, List
 
-from docutura.app.main import get_default_paths, initialize_plugins
-from docutura.core.controller import ConversionController
-from docutura.core.models import ExtractionOptions, OutputFormat
+if TYPE_CHECKING:
+    from docutura.core.controller import ConversionController
+    from docutura.core.models import ExtractionOptions
 
-def test_conversion(pdf_path: str):
-    """Test conversion of a single PDF file."""
+def test_conversion(pdf_paths: List[str]):
+    """Test conversion of one or more PDF files (plugins and controller set up once)."""
 
-    input_file = Path(pdf_path)
-
-    if not input_file.exists():
-        print(f"ERROR: File not found: {pdf_path}")
-        return
-
-    print(f"Testing conversion of: {input_file.name}")
-    print("=" * 60)
+    # Imported here so the usage message doesn't pay for the extraction stack
+    from docutura.app.main import get_default_paths, initialize_plugins
+    from docutura.core.controller import ConversionController
+    from docutura.core.models import ExtractionOptions, OutputFormat
 
     # Initialize
     plugin_registry = initialize_plugins()
@@ -39,6 +36,22 @@ def test_conversion(pdf_path: str):
         theme="corporate",
     )
 
+    for pdf_path in pdf_paths:
+        _convert_one(controller, Path(pdf_path), options)
+
+
+def _convert_one(
+    controller: "ConversionController", input_file: Path, options: "ExtractionOptions"
+):
+    """Convert one file and print its results."""
+
+    if not input_file.exists():
+        print(f"ERROR: File not found: {input_file}")
+        return
+
+    print(f"Testing conversion of: {input_file.name}")
+    print("=" * 60)
+
     # Convert
     print("Converting...")
     result = controller.convert_document(input_file, options)
@@ -66,8 +79,8 @@ def test_conversion(pdf_path: str):
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python test_conversion.py <path_to_pdf>")
+        print("Usage: python test_conversion.py <path_to_pdf> [<path_to_pdf> ...]")
         print("\nExample:")
         print("  python test_conversion.py Working_Documents\\Computer_Studies_TASS_And_CASS_Statistics.pdf")
     else:
-        test_conversion(sys.argv[1])
+        test_conversion(sys.argv[1:])